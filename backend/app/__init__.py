@@ -0,0 +1,4 @@
+import time
+
+# Process cold-start reference point; see app.startup
+PROCESS_STARTED_AT = time.perf_counter()
@@ -0,0 +1,250 @@
+"""
+Columnar, memory-mapped store of every answer from finished games.
+
+Each column lives in its own append-only file of fixed-width little-endian
+values under ``ANSWER_STORE_DIR``.  Finished games append whole columns at
+once; analytics read the files through ``numpy.memmap`` so queries run as
+vectorized scans without loading anything into Python objects.
+"""
+
+import hashlib
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.config import settings
+
+DIFFICULTY_CODES = {"easy": 0, "medium": 1, "hard": 2, "extreme": 3}
+TEAM_CODES = {"A": 0, "B": 1}
+
+COLUMNS: Dict[str, np.dtype] = {
+    "player": np.dtype("<u8"),
+    "team": np.dtype("u1"),
+    "difficulty": np.dtype("u1"),
+    "latency_ms": np.dtype("<u4"),
+    "correct": np.dtype("u1"),
+    "timestamp": np.dtype("<f8"),
+    # Latency components: estimated network time (already excluded from
+    # latency_ms) and time the frame waited on the server before scoring
+    "network_ms": np.dtype("<u4"),
+    "queue_ms": np.dtype("<u4"),
+}
+
+PERCENTILES = (50, 90, 99)
+
+
+def player_key(user_id: str) -> int:
+    """Stable 64-bit key for a user id (the high half of its UUID)."""
+    try:
+        return uuid.UUID(user_id).int >> 64
+    except ValueError:
+        digest = hashlib.blake2b(user_id.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "little")
+
+
+@dataclass
+class AnswerRecord:
+    user_id: str
+    team: str
+    latency_ms: int
+    correct: bool
+    timestamp: float
+    network_ms: int = 0
+    queue_ms: int = 0
+
+
+class AnswerStore:
+    """Append-only column files plus cached read-only memory maps."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._maps: Dict[str, Tuple[int, np.ndarray]] = {}
+
+    def _path(self, column: str) -> str:
+        return os.path.join(self.directory, f"{column}.bin")
+
+    def append(self, difficulty: str, records: List[AnswerRecord]):
+        """Append one finished game's answers, one write per column."""
+        if not records:
+            return
+
+        n = len(records)
+        columns = {
+            "player": np.fromiter(
+                (player_key(r.user_id) for r in records), COLUMNS["player"], n
+            ),
+            "team": np.fromiter(
+                (TEAM_CODES.get(r.team, 0) for r in records), COLUMNS["team"], n
+            ),
+            "difficulty": np.full(
+                n, DIFFICULTY_CODES.get(difficulty, 0), COLUMNS["difficulty"]
+            ),
+            "latency_ms": np.fromiter(
+                (max(r.latency_ms, 0) for r in records), COLUMNS["latency_ms"], n
+            ),
+            "correct": np.fromiter((r.correct for r in records), COLUMNS["correct"], n),
+            "timestamp": np.fromiter(
+                (r.timestamp for r in records), COLUMNS["timestamp"], n
+            ),
+            "network_ms": np.fromiter(
+                (max(r.network_ms, 0) for r in records), COLUMNS["network_ms"], n
+            ),
+            "queue_ms": np.fromiter(
+                (max(r.queue_ms, 0) for r in records), COLUMNS["queue_ms"], n
+            ),
+        }
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._backfill()
+        for name, values in columns.items():
+            with open(self._path(name), "ab") as f:
+                f.write(values.tobytes())
+
+    def _backfill(self):
+        """Zero-fill columns added after a store was created, so rows line up."""
+        first = next(iter(COLUMNS))
+        try:
+            rows = os.path.getsize(self._path(first)) // COLUMNS[first].itemsize
+        except OSError:
+            return
+        for name, dtype in COLUMNS.items():
+            path = self._path(name)
+            if rows and not os.path.exists(path):
+                with open(path, "wb") as f:
+                    f.write(np.zeros(rows, dtype).tobytes())
+
+    def _column(self, name: str) -> np.ndarray:
+        path = self._path(name)
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = 0
+
+        cached = self._maps.get(name)
+        if cached and cached[0] == size:
+            return cached[1]
+
+        dtype = COLUMNS[name]
+        count = size // dtype.itemsize
+        if count == 0:
+            data = np.empty(0, dtype)
+        else:
+            data = np.memmap(path, dtype=dtype, mode="r", shape=(count,))
+        self._maps[name] = (size, data)
+        return data
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """
+        All columns trimmed to a common length.
+
+        A crash between column writes can leave some files one game longer
+        than others; the trailing partial game is simply ignored.
+        """
+        data = {name: self._column(name) for name in COLUMNS}
+        rows = min(len(col) for col in data.values())
+        return {name: col[:rows] for name, col in data.items()}
+
+
+def _latency_summary(latency: np.ndarray, correct: np.ndarray) -> Dict:
+    total = len(correct)
+    hits = int(np.count_nonzero(correct))
+    summary = {
+        "answers": total,
+        "correct": hits,
+        "accuracy": round(hits / total * 100, 1) if total else 0.0,
+    }
+    # Latency percentiles only count correct answers, like avg_response_time_ms
+    correct_latency = latency[correct.astype(bool)]
+    if len(correct_latency):
+        values = np.percentile(correct_latency, PERCENTILES)
+        summary.update({f"p{p}_ms": round(float(v), 1) for p, v in zip(PERCENTILES, values)})
+    else:
+        summary.update({f"p{p}_ms": None for p in PERCENTILES})
+    return summary
+
+
+def _timing_summary(network: np.ndarray, queue: np.ndarray) -> Dict:
+    """Median and tail of the network and server-queue latency components."""
+    if not len(network):
+        return {f"{name}_p{p}_ms": None for name in ("network", "queue") for p in (50, 99)}
+    summary = {}
+    for name, values in (("network", network), ("queue", queue)):
+        p50, p99 = np.percentile(values, (50, 99))
+        summary[f"{name}_p50_ms"] = round(float(p50), 1)
+        summary[f"{name}_p99_ms"] = round(float(p99), 1)
+    return summary
+
+
+def player_report(store: AnswerStore, user_id: str) -> Optional[Dict]:
+    """Latency percentiles, accuracy and a daily accuracy trend for one player."""
+    cols = store.columns()
+    mask = cols["player"] == np.uint64(player_key(user_id))
+    if not mask.any():
+        return None
+
+    latency = cols["latency_ms"][mask]
+    correct = cols["correct"][mask]
+    difficulty = cols["difficulty"][mask]
+    days = (cols["timestamp"][mask] // 86400).astype(np.int64)
+
+    by_difficulty = {
+        name: _latency_summary(latency[difficulty == code], correct[difficulty == code])
+        for name, code in DIFFICULTY_CODES.items()
+        if (difficulty == code).any()
+    }
+
+    unique_days, day_index = np.unique(days, return_inverse=True)
+    day_totals = np.bincount(day_index)
+    day_hits = np.bincount(day_index, weights=correct)
+    trend = [
+        {
+            "date": time.strftime("%Y-%m-%d", time.gmtime(int(day) * 86400)),
+            "answers": int(total),
+            "accuracy": round(float(hits) / int(total) * 100, 1),
+        }
+        for day, total, hits in zip(unique_days, day_totals, day_hits)
+    ]
+
+    return {
+        "user_id": user_id,
+        **_latency_summary(latency, correct),
+        **_timing_summary(cols["network_ms"][mask], cols["queue_ms"][mask]),
+        "by_difficulty": by_difficulty,
+        "trend": trend,
+    }
+
+
+def difficulty_report(store: AnswerStore) -> Dict:
+    """Latency percentiles, latency components and accuracy per difficulty level."""
+    cols = store.columns()
+    difficulty = cols["difficulty"]
+    report = {}
+    for name, code in DIFFICULTY_CODES.items():
+        mask = difficulty == code
+        report[name] = {
+            **_latency_summary(cols["latency_ms"][mask], cols["correct"][mask]),
+            **_timing_summary(cols["network_ms"][mask], cols["queue_ms"][mask]),
+        }
+    return report
+
+
+def team_report(store: AnswerStore) -> Dict:
+    """Answer volume, accuracy and latency per side, plus the share of correct answers."""
+    cols = store.columns()
+    team = cols["team"]
+    report = {
+        name: _latency_summary(cols["latency_ms"][team == code], cols["correct"][team == code])
+        for name, code in TEAM_CODES.items()
+    }
+    total_hits = report["A"]["correct"] + report["B"]["correct"]
+    report["team_a_share"] = (
+        round(report["A"]["correct"] / total_hits * 100, 1) if total_hits else 50.0
+    )
+    return report
+
+
+answer_store = AnswerStore(settings.ANSWER_STORE_DIR)
@@ -8,6 +8,8 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./mathrumble.db"
+    DB_AUTO_CREATE: bool = True  # run create_all on boot
+    DB_POOL_WARM_CONNECTIONS: int = 5
 
     # Game defaults
     WIN_THRESHOLD: int = 10
@@ -17,6 +19,61 @@ class Settings(BaseSettings):
     QUESTION_TIME_LIMIT_MEDIUM: int = 12
     QUESTION_TIME_LIMIT_HARD: int = 10
     QUESTION_TIME_LIMIT_EXTREME: int = 7
+    # Key for per-room question seeds; share it across nodes so any of them
+    # can regenerate a room's questions.  Empty = random per process.
+    QUESTION_SEED_SECRET: str = ""
+
+    # Admission control
+    MAX_ACTIVE_ROOMS: int = 10000
+    MAX_WS_CONNECTIONS: int = 20000
+    WS_MAX_FRAME_BYTES: int = 1024
+    WS_CONNECTION_RATE: float = 5.0  # frames per second
+    WS_CONNECTION_BURST: int = 10
+    # Shared by the whole room at MAX_PLAYERS_PER_TEAM; larger rooms scale up
+    WS_ROOM_RATE: float = 50.0  # frames per second
+    WS_ROOM_BURST: int = 100
+    WS_MAX_VIOLATIONS: int = 20  # rejected frames tolerated before closing
+
+    # Heartbeats
+    WS_HEARTBEAT_INTERVAL_SECONDS: float = 15.0
+    WS_HEARTBEAT_TIMEOUT_SECONDS: float = 45.0  # silence before a socket is reaped
+
+    ROOM_IDLE_TTL_SECONDS: float = 1800.0  # unjoined/abandoned rooms are dropped after
+
+    # Reconnect-with-resume
+    WS_RECONNECT_GRACE_SECONDS: float = 10.0
+    WS_RESUME_BUFFER_SIZE: int = 256  # broadcasts kept per room for replay
+
+    # Match event log
+    EVENT_LOG_ENABLED: bool = True
+    EVENT_LOG_DIR: str = "./event_logs"
+    EVENT_LOG_BUFFER_BYTES: int = 64 * 1024
+
+    # Columnar answer store for analytics
+    ANSWER_STORE_ENABLED: bool = True
+    ANSWER_STORE_DIR: str = "./answer_store"
+
+    # Read-endpoint response cache
+    RESPONSE_CACHE_TTL_SECONDS: float = 30.0
+    RESPONSE_CACHE_MAX_ENTRIES: int = 10000
+
+    # Matchmaking
+    MATCHMAKING_TICK_SECONDS: float = 0.25
+    MATCHMAKING_MAX_WAIT_SECONDS: float = 15.0  # then start with a partial match
+    MATCHMAKING_MIN_PLAYERS: int = 2
+    MATCHMAKING_TICKET_TTL_SECONDS: float = 120.0  # unclaimed matched tickets
+
+    # Finished-game persistence and leaderboard push
+    PERSIST_RESULTS: bool = True
+    LEADERBOARD_PUSH_SIZE: int = 20
+    LEADERBOARD_PUSH_INTERVAL_SECONDS: float = 1.0
+
+    # Streaming exports
+    EXPORT_PAGE_SIZE: int = 1000
+
+    # Large-team mode: rooms allowing this many players per team stop
+    # broadcasting each wrong answer and send per-second team counts instead
+    LARGE_TEAM_MIN_PLAYERS_PER_TEAM: int = 20
 
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://127.0.0.1:3000"]
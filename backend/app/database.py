@@ -15,8 +15,15 @@ async def get_db() -> AsyncSession:
 
 
 async def init_db():
-    """Create all tables on startup."""
+    """Create all tables, and any indexes missing from existing tables, on startup."""
     from app.models import Base  # noqa: F401
 
+    def create_indexes(sync_conn):
+        # create_all skips tables that already exist, along with their indexes
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(sync_conn, checkfirst=True)
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(create_indexes)
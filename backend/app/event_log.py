@@ -0,0 +1,195 @@
+"""
+Append-only binary event log for finished-match replay.
+
+Each game gets one file of fixed-header records::
+
+    <B kind> <I t_ms> <H payload_len> <payload>
+
+``t_ms`` is milliseconds since the log was opened.  Writes go to an in-memory
+buffer that is flushed when it grows past ``EVENT_LOG_BUFFER_BYTES`` and on
+close, so appending an event on the answer path is just a ``struct.pack``.
+Reads memory-map the file and decode records lazily.
+"""
+
+import mmap
+import os
+import struct
+import time
+import uuid
+from typing import Dict, Iterator, Optional
+
+from app.config import settings
+from app.schemas import QuestionResponse
+
+# The last byte is the format version; v2 added the room seed to START
+MAGIC_PREFIX = b"MREV"
+VERSION = 2
+MAGIC = MAGIC_PREFIX + bytes([VERSION])
+
+EVENT_START = 1
+EVENT_QUESTION = 2
+EVENT_ANSWER = 3
+EVENT_SCORE = 4
+EVENT_TICK = 5
+EVENT_END = 6
+
+_HEADER = struct.Struct("<BIH")
+_STR_LEN = struct.Struct("<H")
+_START = struct.Struct("<dQ")
+_START_V1 = struct.Struct("<d")
+_QUESTION = struct.Struct("<dH")
+_ANSWER = struct.Struct("<BI")
+_SCORE = struct.Struct("<hhh")
+_TICK = struct.Struct("<H")
+
+
+def _pack_str(value: str) -> bytes:
+    raw = value.encode("utf-8")
+    return _STR_LEN.pack(len(raw)) + raw
+
+
+def _unpack_str(buf, offset: int):
+    (length,) = _STR_LEN.unpack_from(buf, offset)
+    offset += _STR_LEN.size
+    return bytes(buf[offset : offset + length]).decode("utf-8"), offset + length
+
+
+def log_path(room_id: str) -> str:
+    """Path of a room's event log.  ``room_id`` must be a UUID."""
+    return os.path.join(settings.EVENT_LOG_DIR, f"{uuid.UUID(room_id)}.mrev")
+
+
+class GameEventLog:
+    """Buffered append-only writer for one game's events."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._buffer = bytearray()
+        self._t0 = time.monotonic()
+        if not os.path.exists(path):
+            self._buffer += MAGIC
+
+    def _append(self, kind: int, payload: bytes):
+        t_ms = int((time.monotonic() - self._t0) * 1000)
+        self._buffer += _HEADER.pack(kind, t_ms, len(payload))
+        self._buffer += payload
+        if len(self._buffer) >= settings.EVENT_LOG_BUFFER_BYTES:
+            self.flush()
+
+    def start(self, difficulty: str, seed: int):
+        self._append(EVENT_START, _START.pack(time.time(), seed) + _pack_str(difficulty))
+
+    def question(self, question: QuestionResponse, answer: float):
+        self._append(
+            EVENT_QUESTION,
+            _QUESTION.pack(answer, question.time_limit)
+            + _pack_str(question.id)
+            + _pack_str(question.question),
+        )
+
+    def answer(self, player_id: str, correct: bool, response_time_ms: int):
+        self._append(
+            EVENT_ANSWER,
+            _ANSWER.pack(correct, max(response_time_ms, 0)) + _pack_str(player_id),
+        )
+
+    def score(self, team_a_score: int, team_b_score: int, rope_position: int):
+        self._append(EVENT_SCORE, _SCORE.pack(team_a_score, team_b_score, rope_position))
+
+    def tick(self, timer: int):
+        self._append(EVENT_TICK, _TICK.pack(timer))
+
+    def end(self, winner: Optional[str]):
+        self._append(EVENT_END, (winner or "-").encode("ascii"))
+
+    def flush(self):
+        if not self._buffer:
+            return
+        with open(self.path, "ab") as f:
+            f.write(self._buffer)
+        self._buffer.clear()
+
+    def close(self):
+        self.flush()
+
+
+def open_event_log(room_id: str) -> Optional[GameEventLog]:
+    """Open (or continue) a room's event log, or None if logging is disabled."""
+    if not settings.EVENT_LOG_ENABLED:
+        return None
+    os.makedirs(settings.EVENT_LOG_DIR, exist_ok=True)
+    return GameEventLog(log_path(room_id))
+
+
+def _decode(kind: int, buf, offset: int, end: int, version: int) -> Dict:
+    if kind == EVENT_START:
+        if version == 1:
+            (started_at,) = _START_V1.unpack_from(buf, offset)
+            difficulty, _ = _unpack_str(buf, offset + _START_V1.size)
+            return {"type": "start", "started_at": started_at, "difficulty": difficulty}
+        started_at, seed = _START.unpack_from(buf, offset)
+        difficulty, _ = _unpack_str(buf, offset + _START.size)
+        return {
+            "type": "start",
+            "started_at": started_at,
+            "seed": seed,
+            "difficulty": difficulty,
+        }
+    if kind == EVENT_QUESTION:
+        answer, time_limit = _QUESTION.unpack_from(buf, offset)
+        question_id, offset = _unpack_str(buf, offset + _QUESTION.size)
+        text, _ = _unpack_str(buf, offset)
+        return {
+            "type": "question",
+            "question_id": question_id,
+            "question": text,
+            "answer": answer,
+            "time_limit": time_limit,
+        }
+    if kind == EVENT_ANSWER:
+        correct, response_time_ms = _ANSWER.unpack_from(buf, offset)
+        player_id, _ = _unpack_str(buf, offset + _ANSWER.size)
+        return {
+            "type": "answer",
+            "player_id": player_id,
+            "correct": bool(correct),
+            "response_time_ms": response_time_ms,
+        }
+    if kind == EVENT_SCORE:
+        a, b, rope = _SCORE.unpack_from(buf, offset)
+        return {"type": "score", "team_a_score": a, "team_b_score": b, "rope_position": rope}
+    if kind == EVENT_TICK:
+        (timer,) = _TICK.unpack_from(buf, offset)
+        return {"type": "tick", "timer": timer}
+    if kind == EVENT_END:
+        winner = bytes(buf[offset:end]).decode("ascii")
+        return {"type": "end", "winner": None if winner == "-" else winner}
+    return {"type": "unknown", "kind": kind}
+
+
+def iter_events(path: str) -> Iterator[Dict]:
+    """
+    Stream decoded events from a log file via mmap.
+
+    A truncated trailing record (e.g. from a crash mid-write) ends the stream.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size <= len(MAGIC):
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            version = buf[len(MAGIC) - 1]
+            if buf[: len(MAGIC_PREFIX)] != MAGIC_PREFIX or not 1 <= version <= VERSION:
+                raise ValueError(f"Not an event log: {path}")
+
+            offset = len(MAGIC)
+            size = len(buf)
+            while offset + _HEADER.size <= size:
+                kind, t_ms, length = _HEADER.unpack_from(buf, offset)
+                offset += _HEADER.size
+                end = offset + length
+                if end > size:
+                    break
+                event = _decode(kind, buf, offset, end, version)
+                event["t_ms"] = t_ms
+                yield event
+                offset = end
@@ -1,13 +1,24 @@
 """In-memory game state manager with WebSocket broadcasting."""
 
 import asyncio
+import json
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Set
 
 from fastapi import WebSocket
 
-from app.question_engine import generate_question
+from app.answer_store import AnswerRecord, answer_store
+from app.config import settings
+from app.event_log import GameEventLog, open_event_log
+from app.latency import ClockEstimate, ping_message
+from app.question_engine import question_at, room_seed
+from app.rate_limit import TokenBucket
+from app.response_cache import invalidate_room
+from app.models import generate_uuid
+from app.results import GameResult, PlayerTally, RosterEntry, RoomSnapshot, persist_result
 from app.schemas import GameStateResponse, QuestionResponse
 
 
@@ -18,6 +29,10 @@ class PlayerConnection:
     user_id: str
     username: str
     team: str
+    slot: int = 0  # this player's bit in ActiveGame.answered
+    last_seen: float = field(default_factory=time.monotonic)
+    expiry_handle: Optional[asyncio.TimerHandle] = field(default=None, repr=False)
+    clock: ClockEstimate = field(default_factory=ClockEstimate, repr=False)
 
 
 @dataclass
@@ -35,10 +50,68 @@ class ActiveGame:
     winner: Optional[str] = None
     current_question: Optional[QuestionResponse] = None
     current_answer: Optional[float] = None
-    answered_players: Set[str] = field(default_factory=set)
+    # Bitset of player slots that answered the current question
+    answered: int = 0
     connections: List[PlayerConnection] = field(default_factory=list)
+    # Every attached or detached player, by player_id
+    members: Dict[str, PlayerConnection] = field(default_factory=dict, repr=False)
+    next_slot: int = 0
+    # Large-team mode: answers since the last team_activity event, per team
+    pending_answers: Dict[str, int] = field(default_factory=lambda: {"A": 0, "B": 0})
+    pending_wrong: Dict[str, int] = field(default_factory=lambda: {"A": 0, "B": 0})
     timer_task: Optional[asyncio.Task] = field(default=None, repr=False)
-    question_start_time: float = 0.0
+    question_start_time: float = 0.0  # monotonic
+    rate_bucket: TokenBucket = field(init=False, repr=False)
+    event_log: Optional[GameEventLog] = field(default=None, repr=False)
+    # Every answer this game, flushed to the answer store when it ends
+    answer_records: List[AnswerRecord] = field(default_factory=list, repr=False)
+    # Players whose socket dropped, kept until their reconnect grace expires
+    detached: Dict[str, PlayerConnection] = field(default_factory=dict)
+    # Outbound broadcasts, sequence-numbered for reconnect-with-resume
+    seq: int = 0
+    event_buffer: Deque[Dict] = field(
+        default_factory=lambda: deque(maxlen=settings.WS_RESUME_BUFFER_SIZE),
+        repr=False,
+    )
+    created_at: float = field(default_factory=time.monotonic)
+    # Question k of this room is question_at(difficulty, seed, k)
+    seed: Optional[int] = None
+    question_index: int = 0
+    # Best-of-N series played back to back on the same connections
+    series_length: int = 1
+    round_number: int = 0
+    series_wins: Dict[str, int] = field(default_factory=lambda: {"A": 0, "B": 0})
+    # Who may connect, by player_id; identities come from here, never from
+    # the client.  Ephemeral rooms live only in memory until a game
+    # completes, when the room, this roster and the first result are
+    # written together in one transaction.
+    roster: Dict[str, RosterEntry] = field(default_factory=dict)
+    ephemeral: bool = False
+    max_players_per_team: int = 5
+    room_persisted: bool = False
+    # Games finished in this room; rematches reset the series, not this
+    games_played: int = 0
+    created_on: datetime = field(default_factory=datetime.utcnow)
+
+    def __post_init__(self):
+        if self.seed is None:
+            self.seed = room_seed(self.room_id)
+        # The room budget is sized for a default-capacity room; bigger rooms
+        # get proportionally more so their players aren't starved
+        scale = max(self.max_players_per_team / settings.MAX_PLAYERS_PER_TEAM, 1.0)
+        self.rate_bucket = TokenBucket(
+            settings.WS_ROOM_RATE * scale, int(settings.WS_ROOM_BURST * scale)
+        )
+
+    @property
+    def large_team(self) -> bool:
+        return self.max_players_per_team >= settings.LARGE_TEAM_MIN_PLAYERS_PER_TEAM
+
+    @property
+    def series_winner(self) -> Optional[str]:
+        """The team that has clinched the series, if any."""
+        needed = self.series_length // 2 + 1
+        return next((t for t, wins in self.series_wins.items() if wins >= needed), None)
 
 
 class GameManager:
@@ -46,6 +119,13 @@ class GameManager:
 
     def __init__(self):
         self.games: Dict[str, ActiveGame] = {}
+        self.codes: Dict[str, str] = {}  # room_code -> room_id
+        self.reaped_connections = 0
+        self._background: Set[asyncio.Task] = set()
+
+    def has_capacity(self, count: int = 1) -> bool:
+        """Whether ``count`` more games fit under ``MAX_ACTIVE_ROOMS``."""
+        return len(self.games) + count <= settings.MAX_ACTIVE_ROOMS
 
     def create_game(
         self,
@@ -54,6 +134,10 @@ class GameManager:
         difficulty: str = "easy",
         win_threshold: int = 10,
         round_duration: int = 120,
+        seed: Optional[int] = None,
+        series_length: int = 1,
+        ephemeral: bool = False,
+        max_players_per_team: int = 5,
     ) -> ActiveGame:
         game = ActiveGame(
             room_id=room_id,
@@ -62,35 +146,154 @@ class GameManager:
             win_threshold=win_threshold,
             round_duration=round_duration,
             timer=round_duration,
+            seed=seed,
+            series_length=max(series_length, 1),
+            ephemeral=ephemeral,
+            max_players_per_team=max_players_per_team,
         )
         self.games[room_id] = game
+        self.codes[room_code] = room_id
         return game
 
+    def create_games(
+        self, rooms: List[Dict], series_lengths: Optional[List[int]] = None
+    ) -> List[ActiveGame]:
+        """Register many games in one pass from ``game_rooms`` row dicts."""
+        games = [
+            ActiveGame(
+                room_id=room["id"],
+                room_code=room["room_code"],
+                difficulty=room["difficulty"],
+                win_threshold=room["win_threshold"],
+                round_duration=room["round_duration"],
+                timer=room["round_duration"],
+                series_length=max(series_length, 1),
+                max_players_per_team=room["max_players_per_team"],
+            )
+            for room, series_length in zip(rooms, series_lengths or [1] * len(rooms))
+        ]
+        self.games.update((game.room_id, game) for game in games)
+        self.codes.update((game.room_code, game.room_id) for game in games)
+        return games
+
     def get_game(self, room_id: str) -> Optional[ActiveGame]:
         return self.games.get(room_id)
 
+    def get_game_by_code(self, room_code: str) -> Optional[ActiveGame]:
+        room_id = self.codes.get(room_code)
+        return self.games.get(room_id) if room_id else None
+
+    def _remove_game(self, game: ActiveGame):
+        if self.games.get(game.room_id) is game:
+            del self.games[game.room_id]
+        if self.codes.get(game.room_code) == game.room_id:
+            del self.codes[game.room_code]
+
+    def create_ephemeral_game(
+        self,
+        room_code: str,
+        difficulty: str = "easy",
+        max_players_per_team: int = 5,
+        win_threshold: int = 10,
+        round_duration: int = 120,
+        series_length: int = 1,
+    ) -> ActiveGame:
+        """Register a room that has no DB rows until a game in it completes."""
+        return self.create_game(
+            room_id=generate_uuid(),
+            room_code=room_code,
+            difficulty=difficulty,
+            win_threshold=win_threshold,
+            round_duration=round_duration,
+            series_length=series_length,
+            ephemeral=True,
+            max_players_per_team=max_players_per_team,
+        )
+
+    def join_ephemeral(
+        self, game: ActiveGame, username: str, team: Optional[str] = None
+    ) -> RosterEntry:
+        """
+        Add a player to an ephemeral room's roster, mirroring the rules of
+        ``POST /rooms/{code}/join``.  Raises ``ValueError`` if the room is
+        closed or the team is full.
+
+        The roster is written with the first result, so the room stays
+        closed after its first game even if a rematch puts it back to
+        ``waiting``, just as a stored room is ``finished`` for good.
+        """
+        existing = next((e for e in game.roster.values() if e.username == username), None)
+        if existing:
+            return existing
+        if game.status != "waiting" or game.round_number or game.games_played:
+            raise ValueError("Game already started or finished")
+
+        team_a = sum(1 for e in game.roster.values() if e.team == "A")
+        team_b = len(game.roster) - team_a
+        if team:
+            team = team.upper()
+            if team not in ("A", "B"):
+                raise ValueError(f"Invalid team '{team}'")
+        else:
+            team = "A" if team_a <= team_b else "B"
+        if (team == "A" and team_a >= game.max_players_per_team) or (
+            team == "B" and team_b >= game.max_players_per_team
+        ):
+            raise ValueError(f"Team {team} is full")
+
+        return self.add_player(game, generate_uuid(), generate_uuid(), username, team)
+
+    def add_player(
+        self, game: ActiveGame, player_id: str, user_id: str, username: str, team: str
+    ) -> RosterEntry:
+        """Admit a player (a ``players`` row, or an ephemeral join) to a game's roster."""
+        entry = RosterEntry(player_id=player_id, user_id=user_id, username=username, team=team)
+        game.roster[player_id] = entry
+        return entry
+
     async def connect_player(
         self,
         room_id: str,
         websocket: WebSocket,
         player_id: str,
-        user_id: str,
-        username: str,
-        team: str,
-    ):
+        resume_from: Optional[int] = None,
+    ) -> Optional[PlayerConnection]:
+        """
+        Attach a socket for a rostered player; None if the game or player is
+        unknown.  User id, name and team always come from the roster.
+        """
         game = self.games.get(room_id)
         if not game:
-            return
+            return None
+        entry = game.roster.get(player_id)
+        if not entry:
+            return None
 
         await websocket.accept()
+        user_id, username, team = entry.user_id, entry.username, entry.team
+
+        # A player coming back within the grace period (or replacing a
+        # half-open socket) is resumed silently instead of re-joining.
+        previous = game.detached.pop(player_id, None) or next(
+            (c for c in game.connections if c.player_id == player_id), None
+        )
+        if previous:
+            await self._resume_player(game, previous, websocket, resume_from)
+            if game.room_persisted:
+                await self._send_identity(game, websocket, previous.user_id)
+            return previous
+
         conn = PlayerConnection(
             websocket=websocket,
             player_id=player_id,
             user_id=user_id,
             username=username,
             team=team,
+            slot=game.next_slot,
         )
+        game.next_slot += 1
         game.connections.append(conn)
+        game.members[player_id] = conn
 
         # Notify all players
         await self._broadcast(
@@ -112,21 +315,92 @@ class GameManager:
 
         # Send current state to the new player
         await self._send_state(game, websocket)
+        if game.room_persisted:
+            await self._send_identity(game, websocket, user_id)
+        return conn
+
+    async def _resume_player(
+        self,
+        game: ActiveGame,
+        conn: PlayerConnection,
+        websocket: WebSocket,
+        resume_from: Optional[int],
+    ):
+        """Attach a new socket to an existing player and replay missed events."""
+        if conn.expiry_handle:
+            conn.expiry_handle.cancel()
+            conn.expiry_handle = None
+
+        old_socket = conn.websocket
+        conn.websocket = websocket
+        conn.last_seen = time.monotonic()
+        if conn not in game.connections:
+            game.connections.append(conn)
+        if old_socket is not websocket:
+            try:
+                await old_socket.close()
+            except Exception:
+                pass
+
+        # Replay from the ring buffer if it still covers the gap, else resync
+        buffered = game.event_buffer
+        if resume_from is not None and (
+            not buffered or buffered[0]["seq"] <= resume_from + 1
+        ):
+            try:
+                for message in buffered:
+                    if message["seq"] > resume_from:
+                        await websocket.send_json(message)
+            except Exception:
+                pass
+        else:
+            await self._send_state(game, websocket)
 
-    async def disconnect_player(self, room_id: str, player_id: str):
+    async def disconnect_player(
+        self, room_id: str, player_id: str, websocket: Optional[WebSocket] = None
+    ):
+        """
+        Detach a player whose socket closed.
+
+        The player keeps their slot for ``WS_RECONNECT_GRACE_SECONDS`` so a
+        quick reconnect can resume; only then are they removed and the room
+        told.  ``websocket`` guards against a stale socket detaching a player
+        who has already reconnected on a new one.
+        """
         game = self.games.get(room_id)
         if not game:
             return
 
-        game.connections = [c for c in game.connections if c.player_id != player_id]
+        conn = next((c for c in game.connections if c.player_id == player_id), None)
+        if conn and (websocket is None or conn.websocket is websocket):
+            self._detach(game, conn)
+
+    def _detach(self, game: ActiveGame, conn: PlayerConnection):
+        if conn in game.connections:
+            game.connections.remove(conn)
+        game.detached[conn.player_id] = conn
+
+        grace = settings.WS_RECONNECT_GRACE_SECONDS
+        if grace <= 0:
+            self._spawn(self._expire_player(game, conn.player_id))
+            return
+        conn.expiry_handle = asyncio.get_running_loop().call_later(
+            grace, lambda: self._spawn(self._expire_player(game, conn.player_id))
+        )
+
+    async def _expire_player(self, game: ActiveGame, player_id: str):
+        """Remove a detached player once their grace period has run out."""
+        conn = game.detached.pop(player_id, None)
+        if not conn:
+            return
+        game.members.pop(player_id, None)
 
-        disconnected_username = "Unknown"
         await self._broadcast(
             game,
             {
                 "type": "player_left",
                 "data": {
-                    "username": disconnected_username,
+                    "username": conn.username,
                     "team_a_count": sum(
                         1 for c in game.connections if c.team == "A"
                     ),
@@ -138,22 +412,85 @@ class GameManager:
         )
 
         # Clean up empty games
-        if not game.connections and game.status != "in_progress":
-            self.games.pop(room_id, None)
+        if not game.connections and not game.detached and game.status != "in_progress":
+            self._remove_game(game)
+
+    async def run_heartbeats(self):
+        """
+        Shared heartbeat scheduler for every game socket.
+
+        One task sweeps all connections each ``WS_HEARTBEAT_INTERVAL_SECONDS``:
+        sockets silent for longer than ``WS_HEARTBEAT_TIMEOUT_SECONDS`` are
+        closed and detached, and the rest are pinged.  Any inbound frame
+        (normally the client's ``pong``) refreshes ``last_seen``.
+        """
+        interval = settings.WS_HEARTBEAT_INTERVAL_SECONDS
+        while True:
+            await asyncio.sleep(interval)
+            deadline = time.monotonic() - settings.WS_HEARTBEAT_TIMEOUT_SECONDS
+            sends = []
+            ping = ping_message()
+            for game in list(self.games.values()):
+                for conn in list(game.connections):
+                    if conn.last_seen < deadline:
+                        # Release the slot now; the close handshake can lag
+                        self.reaped_connections += 1
+                        self._detach(game, conn)
+                        sends.append(
+                            conn.websocket.close(code=1001, reason="Heartbeat timeout")
+                        )
+                    else:
+                        sends.append(conn.websocket.send_json(ping))
+            self.reap_idle_games(settings.ROOM_IDLE_TTL_SECONDS)
+            if sends:
+                await asyncio.gather(
+                    *(asyncio.wait_for(send, interval) for send in sends),
+                    return_exceptions=True,
+                )
+
+    def reap_idle_games(self, max_idle: float) -> int:
+        """
+        Drop games nobody is connected to that are older than ``max_idle``
+        seconds and not in progress, e.g. rooms created but never joined.
+        """
+        cutoff = time.monotonic() - max_idle
+        idle = [
+            game
+            for game in self.games.values()
+            if not game.connections
+            and not game.detached
+            and game.status != "in_progress"
+            and game.created_at <= cutoff
+        ]
+        for game in idle:
+            self._remove_game(game)
+        return len(idle)
 
     async def start_game(self, room_id: str):
+        """Start the first game, or the next round of an undecided series."""
         game = self.games.get(room_id)
-        if not game or game.status != "waiting":
+        if not game:
+            return
+        if game.status == "finished" and game.series_winner is None:
+            self._reset_round(game)
+        if game.status != "waiting":
             return
 
         game.status = "in_progress"
+        game.round_number += 1
         game.timer = game.round_duration
+        invalidate_room(game.room_code)
+        game.event_log = open_event_log(game.room_id)
+        if game.event_log:
+            game.event_log.start(game.difficulty, game.seed)
 
         # Generate first question
         self._next_question(game)
 
         # Start game timer
-        game.timer_task = asyncio.create_task(self._run_timer(game))
+        game.timer_task = asyncio.create_task(
+            self._run_timer(game), name=f"timer room={game.room_id}"
+        )
 
         await self._broadcast(
             game,
@@ -161,9 +498,56 @@ class GameManager:
         )
         await self._broadcast_state(game)
 
+    async def rematch(self, room_id: str):
+        """Reset a finished room to a fresh series, keeping everyone connected."""
+        game = self.games.get(room_id)
+        if not game or game.status != "finished":
+            return
+        # Between rounds of an undecided series only start_game may move on
+        if game.series_winner is None and game.series_length > 1:
+            return
+
+        game.round_number = 0
+        game.series_wins = {"A": 0, "B": 0}
+        self._reset_round(game)
+        invalidate_room(game.room_code)
+        await self._broadcast_state(game)
+
+    def _reset_round(self, game: ActiveGame):
+        """Put a finished game back to ``waiting`` in place; rosters are untouched."""
+        game.status = "waiting"
+        game.winner = None
+        game.team_a_score = 0
+        game.team_b_score = 0
+        game.rope_position = 0
+        game.timer = game.round_duration
+        game.current_question = None
+        game.current_answer = None
+        game.answered = 0
+        self._clear_activity(game)
+
     async def submit_answer(
-        self, room_id: str, player_id: str, question_id: str, answer: float
+        self,
+        room_id: str,
+        player_id: str,
+        question_id: str,
+        answer: float,
+        received_at: Optional[float] = None,
+        client_time: Optional[float] = None,
     ) -> Dict:
+        """
+        Score one answer.
+
+        ``received_at`` is the estimated monotonic time the frame arrived, so
+        time spent queued behind other work (``queue_ms``: event-loop lag plus
+        dispatch) is not charged to the player, and
+        ``client_time`` is the client's clock when it sent the answer.  The
+        estimated network time is taken out of ``response_time_ms`` as well;
+        both components are reported alongside it.
+        """
+        now = time.monotonic()
+        if received_at is None:
+            received_at = now
         game = self.games.get(room_id)
         if not game or game.status != "in_progress":
             return {"correct": False, "message": "Game not active"}
@@ -171,30 +555,52 @@ class GameManager:
         if not game.current_question or game.current_question.id != question_id:
             return {"correct": False, "message": "Invalid question"}
 
-        # Anti-cheat: one answer per player per question
-        if player_id in game.answered_players:
-            return {"correct": False, "message": "Already answered this question"}
-
-        game.answered_players.add(player_id)
-
         # Find player team
-        player_conn = next(
-            (c for c in game.connections if c.player_id == player_id), None
-        )
+        player_conn = game.members.get(player_id)
         if not player_conn:
             return {"correct": False, "message": "Player not found"}
 
+        # Anti-cheat: one answer per player per question
+        bit = 1 << player_conn.slot
+        if game.answered & bit:
+            return {"correct": False, "message": "Already answered this question"}
+
+        game.answered |= bit
+
         # Calculate response time
-        response_time_ms = int((time.time() - game.question_start_time) * 1000)
+        # The lag estimate can back-date a fast answer past the question
+        received_at = max(received_at, game.question_start_time)
+        elapsed_ms = (received_at - game.question_start_time) * 1000
+        network_ms = min(player_conn.clock.network_ms(received_at * 1000, client_time), elapsed_ms)
+        response_time_ms = int(max(elapsed_ms - network_ms, 0))
+        queue_ms = int((now - received_at) * 1000)
 
         # Validate answer
         is_correct = abs(answer - game.current_answer) < 0.01
+        if game.event_log:
+            game.event_log.answer(player_id, is_correct, response_time_ms)
+        game.answer_records.append(
+            AnswerRecord(
+                user_id=player_conn.user_id,
+                team=player_conn.team,
+                latency_ms=response_time_ms,
+                correct=is_correct,
+                timestamp=time.time(),
+                network_ms=int(network_ms),
+                queue_ms=queue_ms,
+            )
+        )
+
+        if game.large_team:
+            game.pending_answers[player_conn.team] += 1
 
         result = {
             "correct": is_correct,
             "player_id": player_id,
             "team": player_conn.team,
             "response_time_ms": response_time_ms,
+            "network_ms": int(network_ms),
+            "queue_ms": queue_ms,
         }
 
         if is_correct:
@@ -205,6 +611,10 @@ class GameManager:
             else:
                 game.team_b_score += 1
                 game.rope_position -= 1
+            if game.event_log:
+                game.event_log.score(
+                    game.team_a_score, game.team_b_score, game.rope_position
+                )
 
             # Broadcast score update
             await self._broadcast(
@@ -236,6 +646,9 @@ class GameManager:
             # Next question
             self._next_question(game)
             await self._broadcast_state(game)
+        elif game.large_team:
+            # Reported in aggregate by the next team_activity event
+            game.pending_wrong[player_conn.team] += 1
         else:
             await self._broadcast(
                 game,
@@ -251,11 +664,14 @@ class GameManager:
         return result
 
     def _next_question(self, game: ActiveGame):
-        q, answer = generate_question(game.difficulty)
+        q, answer = question_at(game.difficulty, game.seed, game.question_index)
+        game.question_index += 1
         game.current_question = q
         game.current_answer = answer
-        game.answered_players.clear()
-        game.question_start_time = time.time()
+        game.answered = 0
+        game.question_start_time = time.monotonic()
+        if game.event_log:
+            game.event_log.question(q, answer)
 
     async def _run_timer(self, game: ActiveGame):
         """Countdown timer that ticks every second."""
@@ -263,6 +679,10 @@ class GameManager:
             while game.timer > 0 and game.status == "in_progress":
                 await asyncio.sleep(1)
                 game.timer -= 1
+                if game.event_log:
+                    game.event_log.tick(game.timer)
+                if game.large_team:
+                    await self._flush_activity(game)
 
                 # Broadcast timer every 5 seconds or when <= 10
                 if game.timer % 5 == 0 or game.timer <= 10:
@@ -282,12 +702,48 @@ class GameManager:
         except asyncio.CancelledError:
             pass
 
+    async def _flush_activity(self, game: ActiveGame):
+        """Broadcast per-team answer counts accumulated since the last flush."""
+        if not any(game.pending_answers.values()):
+            return
+        data = {
+            team: {"answers": game.pending_answers[team], "wrong": game.pending_wrong[team]}
+            for team in ("A", "B")
+        }
+        self._clear_activity(game)
+        await self._broadcast(game, {"type": "team_activity", "data": data})
+
+    def _clear_activity(self, game: ActiveGame):
+        for counts in (game.pending_answers, game.pending_wrong):
+            counts["A"] = counts["B"] = 0
+
     async def _end_game(self, game: ActiveGame, winner: Optional[str]):
         game.status = "finished"
         game.winner = winner
-
-        if game.timer_task and not game.timer_task.done():
-            game.timer_task.cancel()
+        game.games_played += 1
+        if winner:
+            game.series_wins[winner] += 1
+        invalidate_room(game.room_code)
+
+        # When time runs out we are inside the timer task itself; cancelling
+        # it would abort the game_over broadcast below.
+        timer_task, game.timer_task = game.timer_task, None
+        if timer_task and timer_task is not asyncio.current_task() and not timer_task.done():
+            timer_task.cancel()
+
+        if game.event_log:
+            game.event_log.end(winner)
+            game.event_log.close()
+            game.event_log = None
+
+        records, game.answer_records = game.answer_records, []
+        if settings.PERSIST_RESULTS and game.ephemeral:
+            self._spawn(self._persist_ephemeral(game, self._result(game, records), records))
+        else:
+            if settings.PERSIST_RESULTS:
+                self._spawn(persist_result(self._result(game, records)))
+            if settings.ANSWER_STORE_ENABLED:
+                answer_store.append(game.difficulty, records)
 
         await self._broadcast(
             game,
@@ -298,27 +754,110 @@ class GameManager:
                     "team_a_score": game.team_a_score,
                     "team_b_score": game.team_b_score,
                     "rope_position": game.rope_position,
+                    "round_number": game.round_number,
+                    "series_wins": dict(game.series_wins),
+                    "series_winner": game.series_winner,
                 },
             },
         )
 
+    def _result(self, game: ActiveGame, records: List[AnswerRecord]) -> GameResult:
+        """Summarize a finished game for persistence."""
+        result = GameResult(
+            room_id=game.room_id,
+            room_code=game.room_code,
+            winner=game.winner,
+            rope_position=game.rope_position,
+            duration=game.round_duration - game.timer,
+        )
+        if game.ephemeral and not game.room_persisted:
+            result.room = RoomSnapshot(
+                difficulty=game.difficulty,
+                max_players_per_team=game.max_players_per_team,
+                win_threshold=game.win_threshold,
+                round_duration=game.round_duration,
+                created_at=game.created_on,
+                roster=list(game.roster.values()),
+            )
+        for conn in [*game.connections, *game.detached.values()]:
+            result.players.setdefault(conn.user_id, PlayerTally(team=conn.team))
+        for record in records:
+            tally = result.players.setdefault(record.user_id, PlayerTally(team=record.team))
+            tally.answers += 1
+            if record.correct:
+                tally.correct += 1
+                tally.correct_response_time_ms += record.latency_ms
+        return result
+
+    async def _persist_ephemeral(
+        self, game: ActiveGame, result: GameResult, records: List[AnswerRecord]
+    ):
+        """
+        Persist an ephemeral room's result, then swap the provisional user
+        ids handed out at join for the real ones so later rounds and the
+        answer store line up with the users table, and tell the clients.
+        """
+        user_ids = await persist_result(result)
+        if user_ids is not None and result.room:
+            game.room_persisted = True
+            if result.room_code != game.room_code:
+                # The code clashed with a stored room and was replaced
+                if self.codes.get(game.room_code) == game.room_id:
+                    del self.codes[game.room_code]
+                game.room_code = result.room_code
+                self.codes[game.room_code] = game.room_id
+            for entry in game.roster.values():
+                entry.user_id = user_ids.get(entry.user_id, entry.user_id)
+            for conn in [*game.connections, *game.detached.values()]:
+                conn.user_id = user_ids.get(conn.user_id, conn.user_id)
+            for record in records:
+                record.user_id = user_ids.get(record.user_id, record.user_id)
+            for conn in list(game.connections):
+                await self._send_identity(game, conn.websocket, conn.user_id)
+        if settings.ANSWER_STORE_ENABLED:
+            answer_store.append(game.difficulty, records)
+
+    def _spawn(self, coro):
+        """Run a fire-and-forget task, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
     async def _broadcast(self, game: ActiveGame, message: Dict):
-        """Send a JSON message to all connected players."""
+        """Sequence-number a JSON message, buffer it and send it to all players."""
+        game.seq += 1
+        message["seq"] = game.seq
+        game.event_buffer.append(message)
+
+        # Serialize once for the whole room, as send_json would per socket
+        text = json.dumps(message, separators=(",", ":"), ensure_ascii=False)
         dead = []
         for conn in game.connections:
             try:
-                await conn.websocket.send_json(message)
+                await conn.websocket.send_text(text)
             except Exception:
                 dead.append(conn)
 
         for conn in dead:
-            game.connections.remove(conn)
+            self._detach(game, conn)
 
     async def _broadcast_state(self, game: ActiveGame):
         """Send full game state to all connected players."""
         state = self._get_state(game)
         await self._broadcast(game, {"type": "state_update", "data": state})
 
+    async def _send_identity(self, game: ActiveGame, websocket: WebSocket, user_id: str):
+        """Send a player the user id and room code the database knows them by."""
+        try:
+            await websocket.send_json(
+                {
+                    "type": "player_identity",
+                    "data": {"user_id": user_id, "room_code": game.room_code},
+                }
+            )
+        except Exception:
+            pass
+
     async def _send_state(self, game: ActiveGame, websocket: WebSocket):
         """Send game state to a single player."""
         state = self._get_state(game)
@@ -336,6 +875,10 @@ class GameManager:
             current_question=game.current_question,
             status=game.status,
             winner=game.winner,
+            round_number=game.round_number,
+            series_length=game.series_length,
+            series_wins=game.series_wins,
+            series_winner=game.series_winner,
         )
         return state.model_dump()
 
@@ -0,0 +1,107 @@
+"""
+Per-connection clock-offset and round-trip estimation over the game socket,
+and the event loop's own scheduling delay.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+# EWMA gains for the smoothed round-trip time and clock offset
+RTT_GAIN = 0.125
+OFFSET_GAIN = 0.25
+# Offsets from pongs slower than this multiple of the smoothed RTT are
+# ignored: a delay on one leg skews the midpoint the offset is taken from
+OFFSET_RTT_SLACK = 1.5
+# Event-loop lag probe: sleep interval (seconds) and EWMA gain
+LAG_PROBE_INTERVAL = 0.05
+LAG_GAIN = 0.2
+
+
+def monotonic_ms() -> float:
+    return time.monotonic() * 1000
+
+
+def ping_message() -> Dict:
+    """A heartbeat ping; the client echoes ``server_time`` with its own clock."""
+    return {"type": "ping", "data": {"server_time": monotonic_ms()}}
+
+
+def as_ms(value: Any) -> Optional[float]:
+    """A client-supplied timestamp, or None if it is missing or not a number."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+class ClockEstimate:
+    """
+    NTP-style estimate of one client's round-trip time and clock offset.
+
+    Each pong carries the ping's ``server_time`` (server monotonic ms) and
+    the client's wall clock when it replied; with the receipt time that
+    gives one RTT sample and one offset sample, assuming symmetric legs.
+    """
+
+    __slots__ = ("rtt_ms", "offset_ms")
+
+    def __init__(self):
+        self.rtt_ms: Optional[float] = None
+        self.offset_ms: Optional[float] = None  # client clock minus server clock
+
+    def observe(self, sent_ms: float, client_ms: Optional[float], received_ms: float):
+        rtt = received_ms - sent_ms
+        if rtt < 0:
+            return
+        if self.rtt_ms is None:
+            self.rtt_ms = rtt
+        else:
+            self.rtt_ms += RTT_GAIN * (rtt - self.rtt_ms)
+
+        if client_ms is None or rtt > self.rtt_ms * OFFSET_RTT_SLACK:
+            return
+        offset = client_ms - (sent_ms + rtt / 2)
+        if self.offset_ms is None:
+            self.offset_ms = offset
+        else:
+            self.offset_ms += OFFSET_GAIN * (offset - self.offset_ms)
+
+    def network_ms(self, received_ms: float, client_ms: Optional[float]) -> float:
+        """
+        Estimated time a question/answer exchange spent on the network.
+
+        The question's trip down is taken as half the RTT.  The answer's trip
+        up is measured from the client's send time when the offset is known,
+        and is otherwise also half the RTT.
+        """
+        if self.rtt_ms is None:
+            return 0.0
+        half = self.rtt_ms / 2
+        upstream = half
+        if client_ms is not None and self.offset_ms is not None:
+            upstream = min(max(received_ms - (client_ms - self.offset_ms), 0.0), self.rtt_ms)
+        return half + upstream
+
+
+class LoopLag:
+    """
+    Smoothed delay between a callback becoming due and the loop running it.
+
+    A frame that reached the socket while the loop was busy is only read
+    once the loop gets to it, so the receive time seen by a handler is
+    late by about this much.
+    """
+
+    def __init__(self):
+        self.lag_ms = 0.0
+
+    async def run(self):
+        """Background loop: measure how late each short sleep wakes up."""
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(LAG_PROBE_INTERVAL)
+            lag = max((time.monotonic() - start - LAG_PROBE_INTERVAL) * 1000, 0.0)
+            self.lag_ms += LAG_GAIN * (lag - self.lag_ms)
+
+
+loop_lag = LoopLag()
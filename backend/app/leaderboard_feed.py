@@ -0,0 +1,134 @@
+"""Debounced leaderboard push to WebSocket subscribers."""
+
+import asyncio
+import json
+import logging
+from typing import Dict, List, Optional, Set
+
+from fastapi import WebSocket
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.config import settings
+from app.database import async_session
+from app.models import LeaderboardStats
+from app.schemas import LeaderboardEntry
+
+logger = logging.getLogger("uvicorn.error")
+
+
+async def top_entries(db: AsyncSession, limit: int) -> List[LeaderboardEntry]:
+    """Top players ranked by wins."""
+    result = await db.execute(
+        select(LeaderboardStats)
+        .options(selectinload(LeaderboardStats.user))
+        .order_by(LeaderboardStats.wins.desc())
+        .limit(limit)
+    )
+    stats_list = result.scalars().all()
+
+    return [
+        LeaderboardEntry(
+            rank=i + 1,
+            username=s.user.username,
+            wins=s.wins,
+            losses=s.losses,
+            accuracy=s.accuracy,
+            avg_response_time_ms=s.avg_response_time_ms,
+        )
+        for i, s in enumerate(stats_list)
+    ]
+
+
+class LeaderboardFeed:
+    """
+    Pushes leaderboard changes to every subscriber.
+
+    ``mark_dirty`` only sets a flag; the ``run`` loop waits
+    ``LEADERBOARD_PUSH_INTERVAL_SECONDS`` after the first change so a burst
+    of finished games coalesces, then runs one query, diffs it against the
+    last snapshot and serializes a single payload that is sent to all
+    subscribers.  New subscribers get the cached full snapshot.
+    """
+
+    def __init__(self):
+        self.subscribers: Set[WebSocket] = set()
+        self._dirty = asyncio.Event()
+        self._entries: Dict[str, LeaderboardEntry] = {}  # by username
+        self._snapshot: Optional[str] = None
+        self.version = 0
+
+    def mark_dirty(self):
+        self._dirty.set()
+
+    async def subscribe(self, websocket: WebSocket):
+        await websocket.accept()
+        if self._snapshot is None:
+            await self._refresh()
+        await websocket.send_text(self._snapshot)
+        self.subscribers.add(websocket)
+
+    def unsubscribe(self, websocket: WebSocket):
+        self.subscribers.discard(websocket)
+
+    async def _refresh(self) -> Optional[str]:
+        """Re-query the leaderboard; return the serialized diff, if anything changed."""
+        async with async_session() as db:
+            entries = await top_entries(db, settings.LEADERBOARD_PUSH_SIZE)
+
+        current = {e.username: e for e in entries}
+        changed = [e.model_dump() for e in entries if self._entries.get(e.username) != e]
+        removed = [name for name in self._entries if name not in current]
+        self._entries = current
+        self.version += 1
+        self._snapshot = json.dumps(
+            {
+                "type": "leaderboard_snapshot",
+                "data": {"version": self.version, "entries": [e.model_dump() for e in entries]},
+            }
+        )
+        if not changed and not removed:
+            return None
+        return json.dumps(
+            {
+                "type": "leaderboard_diff",
+                "data": {"version": self.version, "changed": changed, "removed": removed},
+            }
+        )
+
+    async def _fan_out(self, payload: str):
+        subscribers = list(self.subscribers)
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(ws.send_text(payload), settings.LEADERBOARD_PUSH_INTERVAL_SECONDS)
+                for ws in subscribers
+            ),
+            return_exceptions=True,
+        )
+        for ws, result in zip(subscribers, results):
+            if isinstance(result, BaseException):
+                self.subscribers.discard(ws)
+
+    async def run(self):
+        """Background loop: coalesce changes and push one diff per interval."""
+        while True:
+            await self._dirty.wait()
+            await asyncio.sleep(settings.LEADERBOARD_PUSH_INTERVAL_SECONDS)
+            self._dirty.clear()
+
+            if not self.subscribers:
+                # Nobody is watching; the next subscriber triggers a fresh query
+                self._snapshot = None
+                continue
+
+            try:
+                payload = await self._refresh()
+            except Exception:
+                logger.exception("Leaderboard refresh failed")
+                continue
+            if payload:
+                await self._fan_out(payload)
+
+
+leaderboard_feed = LeaderboardFeed()
@@ -0,0 +1,71 @@
+"""Batched user lookups and room-code allocation shared by provisioning and results."""
+
+import random
+import string
+from datetime import datetime
+from typing import Dict, Iterable, List, Set
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import GameRoom, LeaderboardStats, User, generate_uuid
+
+# Keep IN (...) lists well under SQLite's bound-parameter limit.
+IN_CHUNK = 500
+
+
+def generate_room_code(length: int = 6) -> str:
+    return "".join(random.choices(string.ascii_uppercase + string.digits, k=length))
+
+
+def chunks(items: List, size: int) -> Iterable[List]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+async def resolve_users(db: AsyncSession, usernames: Set[str]) -> Dict[str, str]:
+    """Map usernames to user ids, bulk-creating any users that don't exist yet."""
+    names = sorted(usernames)
+    user_ids: Dict[str, str] = {}
+    for chunk in chunks(names, IN_CHUNK):
+        result = await db.execute(
+            select(User.username, User.id).where(User.username.in_(chunk))
+        )
+        user_ids.update(result.tuples().all())
+
+    missing = [name for name in names if name not in user_ids]
+    if missing:
+        now = datetime.utcnow()
+        new_users = [
+            {"id": generate_uuid(), "username": name, "created_at": now}
+            for name in missing
+        ]
+        await db.execute(insert(User), new_users)
+        await db.execute(
+            insert(LeaderboardStats),
+            [{"id": generate_uuid(), "user_id": u["id"]} for u in new_users],
+        )
+        user_ids.update((u["username"], u["id"]) for u in new_users)
+
+    return user_ids
+
+
+async def unique_room_codes(db: AsyncSession, count: int) -> List[str]:
+    """Generate ``count`` room codes unused both in this batch and in the DB."""
+    codes: Set[str] = set()
+    while len(codes) < count:
+        fresh = set()
+        while len(codes) + len(fresh) < count:
+            code = generate_room_code()
+            if code not in codes:
+                fresh.add(code)
+
+        taken: Set[str] = set()
+        for chunk in chunks(list(fresh), IN_CHUNK):
+            result = await db.execute(
+                select(GameRoom.room_code).where(GameRoom.room_code.in_(chunk))
+            )
+            taken.update(result.scalars().all())
+        codes.update(fresh - taken)
+
+    return list(codes)
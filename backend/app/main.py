@@ -1,20 +1,49 @@
 """FastAPI application entry point."""
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from app.config import settings
 from app.database import init_db
-from app.routers import admin, leaderboard, rooms, websocket
+from app.game_manager import game_manager
+from app.latency import loop_lag
+from app.leaderboard_feed import leaderboard_feed
+from app.matchmaking import matchmaker
+from app.profiler import ProfilerTagMiddleware
+from app.routers import (
+    admin,
+    analytics,
+    export,
+    leaderboard,
+    matchmaking,
+    profiling,
+    replay,
+    rooms,
+    websocket,
+)
+from app.startup import FirstRequestTimer, readiness, warm_up
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup / shutdown lifecycle."""
-    await init_db()
+    if settings.DB_AUTO_CREATE:
+        await init_db()
+    # Warm-up runs in the background: /health answers at once, /ready once warm
+    background = [
+        asyncio.create_task(warm_up()),
+        asyncio.create_task(game_manager.run_heartbeats()),
+        asyncio.create_task(matchmaker.run()),
+        asyncio.create_task(leaderboard_feed.run()),
+        asyncio.create_task(loop_lag.run()),
+    ]
     yield
+    for task in background:
+        task.cancel()
 
 
 app = FastAPI(
@@ -33,13 +62,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(FirstRequestTimer)
+app.add_middleware(ProfilerTagMiddleware)
+
 # Routers
 app.include_router(rooms.router)
 app.include_router(websocket.router)
 app.include_router(leaderboard.router)
 app.include_router(admin.router)
+app.include_router(replay.router)
+app.include_router(analytics.router)
+app.include_router(matchmaking.router)
+app.include_router(export.router)
+app.include_router(profiling.router)
 
 
 @app.get("/health")
 async def health():
     return {"status": "ok", "game": "Math Tug-of-War"}
+
+
+@app.get("/ready")
+async def ready():
+    """Readiness probe: 503 until startup warm-up has finished."""
+    return JSONResponse(readiness.report(), status_code=200 if readiness.ready else 503)
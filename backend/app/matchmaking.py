@@ -0,0 +1,183 @@
+"""Per-difficulty matchmaking queues that auto-fill rooms in batches."""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.database import async_session
+from app.game_manager import game_manager
+from app.provisioning import provision_rooms
+from app.question_engine import DIFFICULTIES
+from app.schemas import BulkPlayerResponse, BulkRoomResponse, BulkRosterEntry, BulkRoomSpec
+
+logger = logging.getLogger("uvicorn.error")
+
+
+@dataclass
+class Ticket:
+    id: str
+    username: str
+    difficulty: str
+    enqueued_at: float
+    status: str = "queued"  # queued, matching, matched, cancelled
+    room: Optional[BulkRoomResponse] = None
+    player: Optional[BulkPlayerResponse] = None
+    matched_at: float = 0.0
+    done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+
+class Matchmaker:
+    """
+    FIFO bucket per difficulty; enqueue and cancel are O(1).
+
+    A single background task drains the buckets every
+    ``MATCHMAKING_TICK_SECONDS``: full matches (two teams of
+    ``MAX_PLAYERS_PER_TEAM``) form immediately, and a bucket whose oldest
+    ticket has waited ``MATCHMAKING_MAX_WAIT_SECONDS`` starts with whoever is
+    there.  Every match formed in a tick is provisioned in one bulk
+    transaction.
+    """
+
+    def __init__(self):
+        self.buckets: Dict[str, Deque[Ticket]] = {d: deque() for d in DIFFICULTIES}
+        self.tickets: Dict[str, Ticket] = {}
+        self._queued_by_username: Dict[str, Ticket] = {}
+        self._matched: Deque[Ticket] = deque()
+
+    def enqueue(self, username: str, difficulty: str) -> Ticket:
+        if difficulty not in self.buckets:
+            raise ValueError(f"Invalid difficulty '{difficulty}'")
+
+        existing = self._queued_by_username.get(username)
+        if existing and existing.status in ("queued", "matching"):
+            return existing
+
+        ticket = Ticket(
+            id=str(uuid.uuid4()),
+            username=username,
+            difficulty=difficulty,
+            enqueued_at=time.monotonic(),
+        )
+        self.tickets[ticket.id] = ticket
+        self._queued_by_username[username] = ticket
+        self.buckets[difficulty].append(ticket)
+        return ticket
+
+    def cancel(self, ticket_id: str) -> Optional[Ticket]:
+        """
+        Cancel a queued ticket; it is skipped lazily when its bucket drains.
+        A ticket already being provisioned into a room is left as it is.
+        """
+        ticket = self.tickets.get(ticket_id)
+        if ticket and ticket.status == "queued":
+            ticket.status = "cancelled"
+            self._queued_by_username.pop(ticket.username, None)
+            self.tickets.pop(ticket_id, None)
+            ticket.done.set()
+        return ticket
+
+    def get(self, ticket_id: str) -> Optional[Ticket]:
+        return self.tickets.get(ticket_id)
+
+    def _take(self, bucket: Deque[Ticket], count: int) -> List[Ticket]:
+        taken: List[Ticket] = []
+        while bucket and len(taken) < count:
+            ticket = bucket.popleft()
+            if ticket.status == "queued":
+                taken.append(ticket)
+        return taken
+
+    def _form_matches(self, now: float) -> List[Tuple[str, List[Ticket]]]:
+        size = 2 * settings.MAX_PLAYERS_PER_TEAM
+        matches: List[Tuple[str, List[Ticket]]] = []
+        budget = settings.MAX_ACTIVE_ROOMS - len(game_manager.games)
+
+        for difficulty, bucket in self.buckets.items():
+            # Drop cancelled tickets from the head so wait times are accurate
+            while bucket and bucket[0].status != "queued":
+                bucket.popleft()
+
+            while len(bucket) >= size and len(matches) < budget:
+                players = self._take(bucket, size)
+                if len(players) < size:
+                    # Cancelled tickets made it short; put the rest back in order
+                    bucket.extendleft(reversed(players))
+                    break
+                matches.append((difficulty, players))
+
+            if (
+                bucket
+                and now - bucket[0].enqueued_at >= settings.MATCHMAKING_MAX_WAIT_SECONDS
+                and len(bucket) >= settings.MATCHMAKING_MIN_PLAYERS
+                and len(matches) < budget
+            ):
+                players = self._take(bucket, size)
+                if len(players) >= settings.MATCHMAKING_MIN_PLAYERS:
+                    matches.append((difficulty, players))
+                else:
+                    bucket.extendleft(reversed(players))
+
+        return matches
+
+    async def _provision(self, matches: List[Tuple[str, List[Ticket]]]):
+        # Their seats are on the rosters being written; no cancelling now
+        for _, players in matches:
+            for ticket in players:
+                ticket.status = "matching"
+
+        specs = [
+            BulkRoomSpec(
+                difficulty=difficulty,
+                max_players_per_team=settings.MAX_PLAYERS_PER_TEAM,
+                win_threshold=settings.WIN_THRESHOLD,
+                round_duration=settings.ROUND_DURATION,
+                roster=[BulkRosterEntry(username=t.username) for t in players],
+            )
+            for difficulty, players in matches
+        ]
+
+        try:
+            async with async_session() as db:
+                rooms = await provision_rooms(db, specs)
+        except Exception:
+            logger.exception("Matchmaking failed to provision %d rooms", len(specs))
+            # Requeue at the front, preserving order, for the next tick
+            for difficulty, players in reversed(matches):
+                for ticket in players:
+                    ticket.status = "queued"
+                self.buckets[difficulty].extendleft(reversed(players))
+            return
+
+        now = time.monotonic()
+        for (_, players), room in zip(matches, rooms):
+            for ticket, player in zip(players, room.players):
+                ticket.status = "matched"
+                ticket.room = room
+                ticket.player = player
+                ticket.matched_at = now
+                self._queued_by_username.pop(ticket.username, None)
+                self._matched.append(ticket)
+                ticket.done.set()
+
+    def _expire_matched(self, now: float):
+        cutoff = now - settings.MATCHMAKING_TICKET_TTL_SECONDS
+        while self._matched and self._matched[0].matched_at < cutoff:
+            self.tickets.pop(self._matched.popleft().id, None)
+
+    async def run(self):
+        """Background loop that forms and provisions matches each tick."""
+        while True:
+            await asyncio.sleep(settings.MATCHMAKING_TICK_SECONDS)
+            now = time.monotonic()
+            matches = self._form_matches(now)
+            if matches:
+                await self._provision(matches)
+            self._expire_matched(now)
+
+
+matchmaker = Matchmaker()
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -44,11 +44,12 @@ class GameRoom(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
     players: Mapped[List["Player"]] = relationship(back_populates="room")
-    match: Mapped[Optional["Match"]] = relationship(back_populates="room", uselist=False)
+    matches: Mapped[List["Match"]] = relationship(back_populates="room")
 
 
 class Player(Base):
     __tablename__ = "players"
+    __table_args__ = (Index("ix_players_user_id_room_id", "user_id", "room_id"),)
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
     user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False)
@@ -64,6 +65,11 @@ class Player(Base):
 
 class Match(Base):
     __tablename__ = "matches"
+    __table_args__ = (
+        # Keyset pagination for exports walks (finished_at, id)
+        Index("ix_matches_finished_at_id", "finished_at", "id"),
+        Index("ix_matches_room_id", "room_id"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
     room_id: Mapped[str] = mapped_column(
@@ -74,7 +80,7 @@ class Match(Base):
     duration: Mapped[int] = mapped_column(Integer, default=0)  # seconds
     finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
-    room: Mapped["GameRoom"] = relationship(back_populates="match")
+    room: Mapped["GameRoom"] = relationship(back_populates="matches")
 
 
 class Question(Base):
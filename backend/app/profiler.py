@@ -0,0 +1,182 @@
+"""
+On-demand sampling profiler for the running server.
+
+A background thread reads every thread's current stack through
+``sys._current_frames()`` at a fixed interval and counts them as collapsed
+stacks (``root;frame;frame count``), the input format of flamegraph.pl and
+speedscope.  Nothing is instrumented: the only cost outside a run is an
+``if profiler.running`` check where work is tagged.
+
+Event-loop samples are rooted at whatever the loop's current task is doing:
+the route of an HTTP request, the message type and room of a WebSocket
+frame, or, for untagged tasks, the task name or coroutine.
+"""
+
+import asyncio
+import concurrent.futures
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Dict, List, Optional
+
+
+class SamplingProfiler:
+    """Samples stacks from a helper thread; one run at a time per process."""
+
+    def __init__(self):
+        self.running = False
+        self._lock = threading.Lock()
+        self._tags: "weakref.WeakKeyDictionary[asyncio.Task, object]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._labels: Dict[CodeType, str] = {}
+
+    def tag(self, label: object):
+        """
+        Attribute the current task's samples to ``label`` (a string, a tuple
+        joined with spaces, or an ASGI scope resolved to its route).
+        """
+        if not self.running:
+            return
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            return
+        if task is not None:
+            self._tags[task] = label
+
+    def acquire(self) -> bool:
+        """Claim the profiler for one run; False if a run is already going."""
+        if not self._lock.acquire(blocking=False):
+            return False
+        self._tags.clear()
+        self.running = True
+        return True
+
+    async def run(self, duration: float, interval: float) -> Counter:
+        """
+        Sample for ``duration`` seconds from a dedicated thread; call on the
+        event loop after ``acquire``.
+
+        The thread always runs to completion and releases the profiler, even
+        if the awaiting request goes away.
+        """
+        loop = asyncio.get_running_loop()
+        loop_thread = threading.get_ident()
+        result: concurrent.futures.Future = concurrent.futures.Future()
+
+        def target():
+            try:
+                stacks = self._sample(duration, interval, loop, loop_thread)
+            except Exception as e:
+                outcome, value = result.set_exception, e
+            else:
+                outcome, value = result.set_result, stacks
+            try:
+                outcome(value)
+            except concurrent.futures.InvalidStateError:
+                pass  # the request was cancelled
+
+        threading.Thread(target=target, name="sampling-profiler", daemon=True).start()
+        return await asyncio.wrap_future(result)
+
+    def _sample(
+        self, duration: float, interval: float, loop: asyncio.AbstractEventLoop, loop_thread: int
+    ) -> Counter:
+        stacks: Counter = Counter()
+        names: Dict[int, str] = {}
+        deadline = time.monotonic() + duration
+        try:
+            while time.monotonic() < deadline:
+                self._sample_once(stacks, names, loop, loop_thread)
+                time.sleep(interval)
+        finally:
+            self._tags.clear()
+            self._labels.clear()
+            self.running = False
+            self._lock.release()
+        return stacks
+
+    def _sample_once(
+        self,
+        stacks: Counter,
+        names: Dict[int, str],
+        loop: asyncio.AbstractEventLoop,
+        loop_thread: int,
+    ):
+        me = threading.get_ident()
+        for ident, frame in sys._current_frames().items():
+            if ident == me:
+                continue
+            if ident == loop_thread:
+                root = self._loop_root(loop)
+            else:
+                if ident not in names:
+                    names.update((t.ident, t.name) for t in threading.enumerate())
+                root = f"thread {names.get(ident, ident)}"
+            stacks[self._collapse(root, frame)] += 1
+
+    def _loop_root(self, loop: asyncio.AbstractEventLoop) -> str:
+        # Reading another thread's current task is a plain dict lookup
+        task = asyncio.current_task(loop)
+        if task is None:  # idle in select(), or running a plain callback
+            return "loop"
+        label = self._tags.get(task)
+        if label is None:
+            name = task.get_name()
+            if name.startswith("Task-"):
+                coro = task.get_coro()
+                name = getattr(coro, "__qualname__", name)
+            return f"task {name}"
+        if isinstance(label, dict):  # ASGI scope; the route is known once matched
+            route = label.get("route")
+            path = getattr(route, "path", None) or label.get("path", "?")
+            return f"{label.get('method', 'WS')} {path}"
+        if isinstance(label, tuple):
+            return " ".join(str(part) for part in label)
+        return str(label)
+
+    def _collapse(self, root: str, frame: Optional[FrameType]) -> str:
+        frames: List[str] = []
+        while frame is not None:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = self._labels[code] = _frame_label(frame)
+            frames.append(label)
+            frame = frame.f_back
+        frames.append(root)
+        frames.reverse()
+        return ";".join(frames)
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__") or os.path.basename(code.co_filename)
+    name = getattr(code, "co_qualname", code.co_name)
+    # ';' separates frames in collapsed stacks
+    return f"{module}:{name}".replace(";", ":")
+
+
+def collapsed(stacks: Counter) -> str:
+    """Render stack counts as collapsed-stack text, heaviest first."""
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+class ProfilerTagMiddleware:
+    """ASGI middleware that tags each request's task with its scope while profiling."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if profiler.running and scope["type"] in ("http", "websocket"):
+            profiler.tag(scope)
+        await self.app(scope, receive, send)
+
+
+profiler = SamplingProfiler()
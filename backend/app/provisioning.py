@@ -0,0 +1,156 @@
+"""Bulk room provisioning for tournaments and classrooms."""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.game_manager import ActiveGame, game_manager
+from app.lookups import resolve_users, unique_room_codes
+from app.models import GameRoom, Player, generate_uuid
+from app.schemas import BulkPlayerResponse, BulkRoomResponse, BulkRoomSpec
+
+
+def _assign_teams(spec: BulkRoomSpec) -> List[str]:
+    """Resolve the team of every roster entry, balancing unassigned players."""
+    counts = {"A": 0, "B": 0}
+    teams: List[str] = []
+    seen: Set[str] = set()
+    for entry in spec.roster:
+        if entry.username in seen:
+            raise ValueError(f"Duplicate username '{entry.username}' in roster")
+        seen.add(entry.username)
+        if entry.team:
+            team = entry.team.upper()
+            if team not in counts:
+                raise ValueError(f"Invalid team '{entry.team}'")
+        else:
+            team = "A" if counts["A"] <= counts["B"] else "B"
+        counts[team] += 1
+        if counts[team] > spec.max_players_per_team:
+            raise ValueError(f"Team {team} is full")
+        teams.append(team)
+    return teams
+
+
+async def provision_rooms(
+    db: AsyncSession, specs: List[BulkRoomSpec]
+) -> List[BulkRoomResponse]:
+    """
+    Create many rooms with pre-assigned rosters in a single transaction.
+
+    Users, rooms and players are written with one bulk INSERT per table and
+    the matching in-memory games are registered in a single pass.  Raises
+    ``ValueError`` if any roster is invalid; nothing is written in that case.
+    """
+    teams_per_room = [_assign_teams(spec) for spec in specs]
+
+    user_ids = await resolve_users(
+        db, {entry.username for spec in specs for entry in spec.roster}
+    )
+    codes = await unique_room_codes(db, len(specs))
+
+    now = datetime.utcnow()
+    room_rows: List[Dict] = []
+    player_rows: List[Dict] = []
+    results: List[BulkRoomResponse] = []
+
+    for spec, teams, code in zip(specs, teams_per_room, codes):
+        room_id = generate_uuid()
+        room_rows.append(
+            {
+                "id": room_id,
+                "room_code": code,
+                "status": "waiting",
+                "difficulty": spec.difficulty,
+                "max_players_per_team": spec.max_players_per_team,
+                "win_threshold": spec.win_threshold,
+                "round_duration": spec.round_duration,
+                "created_at": now,
+            }
+        )
+
+        players: List[BulkPlayerResponse] = []
+        for entry, team in zip(spec.roster, teams):
+            player_id = generate_uuid()
+            user_id = user_ids[entry.username]
+            player_rows.append(
+                {
+                    "id": player_id,
+                    "user_id": user_id,
+                    "room_id": room_id,
+                    "team": team,
+                    "joined_at": now,
+                }
+            )
+            players.append(
+                BulkPlayerResponse(
+                    username=entry.username,
+                    player_id=player_id,
+                    user_id=user_id,
+                    team=team,
+                )
+            )
+
+        results.append(
+            BulkRoomResponse(
+                room_id=room_id,
+                room_code=code,
+                difficulty=spec.difficulty,
+                status="waiting",
+                players=players,
+            )
+        )
+
+    if room_rows:
+        await db.execute(insert(GameRoom), room_rows)
+    if player_rows:
+        await db.execute(insert(Player), player_rows)
+    await db.commit()
+
+    games = game_manager.create_games(room_rows, [spec.series_length for spec in specs])
+    for game, room in zip(games, results):
+        for player in room.players:
+            game_manager.add_player(
+                game, player.player_id, player.user_id, player.username, player.team
+            )
+
+    return results
+
+
+async def restore_game(db: AsyncSession, room_id: str) -> Optional[ActiveGame]:
+    """
+    Rebuild the in-memory game of a ``waiting`` room from its rows.
+
+    Idle reaping drops games nobody has connected to, such as pre-provisioned
+    tournament rooms; the first player to connect brings the game back.
+    """
+    result = await db.execute(
+        select(GameRoom)
+        .where(GameRoom.id == room_id, GameRoom.status == "waiting")
+        .options(selectinload(GameRoom.players).selectinload(Player.user))
+    )
+    room = result.scalar_one_or_none()
+    if not room:
+        return None
+
+    # Another connection may have restored it while we were querying
+    game = game_manager.get_game(room_id)
+    if game:
+        return game
+    if not game_manager.has_capacity():
+        return None
+
+    game = game_manager.create_game(
+        room_id=room.id,
+        room_code=room.room_code,
+        difficulty=room.difficulty,
+        win_threshold=room.win_threshold,
+        round_duration=room.round_duration,
+        max_players_per_team=room.max_players_per_team,
+    )
+    for player in room.players:
+        game_manager.add_player(game, player.id, player.user_id, player.user.username, player.team)
+    return game
@@ -1,13 +1,81 @@
 """Dynamic math question generator by difficulty level."""
 
+import hashlib
 import random
+import re
+import secrets
 import uuid
+from functools import lru_cache
+from typing import Optional, Sequence, TypeVar
 
 from app.config import settings
 from app.schemas import QuestionResponse
 
+DIFFICULTIES = ("easy", "medium", "hard", "extreme")
 
-def generate_question(difficulty: str) -> QuestionResponse:
+T = TypeVar("T")
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN64 = 0x9E3779B97F4A7C15
+_QUESTION_ID_NAMESPACE = uuid.UUID("6d2c1a43-6b1e-4c8e-9a53-1f3f0e2b7c51")
+
+# Nodes must share QUESTION_SEED_SECRET to regenerate each other's streams;
+# without one, seeds are only stable within this process.
+_SEED_KEY = (settings.QUESTION_SEED_SECRET or secrets.token_hex(16)).encode()
+
+
+def _splitmix64(x: int) -> int:
+    x = (x + _GOLDEN64) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+class CounterRNG:
+    """
+    Counter-based RNG: draw ``n`` for question ``index`` of stream ``seed``
+    is a pure function of ``(seed, index, n)``, so any question in a stream
+    can be produced directly, with no state carried over from earlier ones.
+    Implements the ``randint``/``choice`` subset of ``random`` used here.
+    """
+
+    __slots__ = ("_key", "_draw")
+
+    def __init__(self, seed: int, index: int):
+        self._key = _splitmix64(seed ^ _splitmix64(index))
+        self._draw = 0
+
+    def _next64(self) -> int:
+        self._draw += 1
+        return _splitmix64(self._key ^ (self._draw * _GOLDEN64 & _MASK64))
+
+    def randint(self, a: int, b: int) -> int:
+        return a + ((self._next64() * (b - a + 1)) >> 64)
+
+    def choice(self, seq: Sequence[T]) -> T:
+        return seq[(self._next64() * len(seq)) >> 64]
+
+
+def room_seed(room_id: str) -> int:
+    """The question-stream seed for a room, keyed with the server secret."""
+    digest = hashlib.blake2b(room_id.encode("utf-8"), key=_SEED_KEY, digest_size=8)
+    return int.from_bytes(digest.digest(), "little")
+
+
+def question_at(
+    difficulty: str, seed: int, index: int
+) -> tuple[QuestionResponse, float]:
+    """Question ``index`` of the stream for ``seed``, computed in O(1)."""
+    return generate_question(
+        difficulty,
+        rng=CounterRNG(seed, index),
+        question_id=str(uuid.uuid5(_QUESTION_ID_NAMESPACE, f"{seed}:{index}")),
+    )
+
+
+def generate_question(
+    difficulty: str, rng=random, question_id: Optional[str] = None
+) -> tuple[QuestionResponse, float]:
     """Generate a math question based on difficulty level."""
     generators = {
         "easy": _easy,
@@ -16,7 +84,7 @@ def generate_question(difficulty: str) -> QuestionResponse:
         "extreme": _extreme,
     }
     gen = generators.get(difficulty, _easy)
-    text, answer = gen()
+    text, answer = gen(rng)
 
     time_limits = {
         "easy": settings.QUESTION_TIME_LIMIT_EASY,
@@ -26,18 +94,18 @@ def generate_question(difficulty: str) -> QuestionResponse:
     }
 
     return QuestionResponse(
-        id=str(uuid.uuid4()),
+        id=question_id or str(uuid.uuid4()),
         question=text,
         difficulty=difficulty,
         time_limit=time_limits.get(difficulty, 10),
     ), answer
 
 
-def _easy() -> tuple[str, float]:
+def _easy(rng) -> tuple[str, float]:
     """Single-digit addition or subtraction."""
-    a = random.randint(1, 9)
-    b = random.randint(1, 9)
-    op = random.choice(["+", "-"])
+    a = rng.randint(1, 9)
+    b = rng.randint(1, 9)
+    op = rng.choice(["+", "-"])
     if op == "+":
         return f"{a} + {b}", float(a + b)
     else:
@@ -46,11 +114,11 @@ def _easy() -> tuple[str, float]:
         return f"{a} - {b}", float(a - b)
 
 
-def _medium() -> tuple[str, float]:
+def _medium(rng) -> tuple[str, float]:
     """Two-digit addition or subtraction."""
-    a = random.randint(10, 99)
-    b = random.randint(10, 99)
-    op = random.choice(["+", "-"])
+    a = rng.randint(10, 99)
+    b = rng.randint(10, 99)
+    op = rng.choice(["+", "-"])
     if op == "+":
         return f"{a} + {b}", float(a + b)
     else:
@@ -58,42 +126,128 @@ def _medium() -> tuple[str, float]:
         return f"{a} - {b}", float(a - b)
 
 
-def _hard() -> tuple[str, float]:
+def _hard(rng) -> tuple[str, float]:
     """Multiplication or division with clean results."""
-    op = random.choice(["×", "÷"])
+    op = rng.choice(["×", "÷"])
     if op == "×":
-        a = random.randint(2, 12)
-        b = random.randint(2, 12)
+        a = rng.randint(2, 12)
+        b = rng.randint(2, 12)
         return f"{a} × {b}", float(a * b)
     else:
-        b = random.randint(2, 12)
-        result = random.randint(2, 12)
+        b = rng.randint(2, 12)
+        result = rng.randint(2, 12)
         a = b * result  # Ensures clean division
         return f"{a} ÷ {b}", float(result)
 
 
-def _extreme() -> tuple[str, float]:
+def _extreme(rng) -> tuple[str, float]:
     """Mixed operations, multi-step problems."""
-    variant = random.choice(["mul_add", "mul_sub", "div_add", "two_mul"])
+    variant = rng.choice(["mul_add", "mul_sub", "div_add", "two_mul"])
     if variant == "mul_add":
-        a = random.randint(2, 15)
-        b = random.randint(2, 9)
-        c = random.randint(1, 20)
+        a = rng.randint(2, 15)
+        b = rng.randint(2, 9)
+        c = rng.randint(1, 20)
         return f"({a} × {b}) + {c}", float(a * b + c)
     elif variant == "mul_sub":
-        a = random.randint(2, 15)
-        b = random.randint(2, 9)
-        c = random.randint(1, 20)
+        a = rng.randint(2, 15)
+        b = rng.randint(2, 9)
+        c = rng.randint(1, 20)
         result = a * b - c
         return f"({a} × {b}) - {c}", float(result)
     elif variant == "div_add":
-        b = random.randint(2, 9)
-        quotient = random.randint(2, 12)
+        b = rng.randint(2, 9)
+        quotient = rng.randint(2, 12)
         a = b * quotient
-        c = random.randint(1, 20)
+        c = rng.randint(1, 20)
         return f"({a} ÷ {b}) + {c}", float(quotient + c)
     else:  # two_mul
-        a = random.randint(2, 9)
-        b = random.randint(2, 9)
-        c = random.randint(2, 9)
+        a = rng.randint(2, 9)
+        b = rng.randint(2, 9)
+        c = rng.randint(2, 9)
         return f"{a} × {b} × {c}", float(a * b * c)
+
+
+# ── Answer checking ───────────────────────────────────────────────────
+
+_TOKEN_RE = re.compile(r"\s*(?:(\d+(?:\.\d+)?)|(.))")
+_MAX_EXPRESSION_LENGTH = 200
+_OPERATORS = {"+": "+", "-": "-", "×": "*", "x": "*", "*": "*", "÷": "/", "/": "/"}
+
+
+def _tokenize(text: str) -> list[str]:
+    tokens = []
+    for number, symbol in _TOKEN_RE.findall(text.strip()):
+        if number:
+            tokens.append(number)
+        elif symbol in _OPERATORS:
+            tokens.append(_OPERATORS[symbol])
+        elif symbol in "()":
+            tokens.append(symbol)
+        else:
+            raise ValueError(f"Unexpected character {symbol!r}")
+    return tokens
+
+
+@lru_cache(maxsize=65536)
+def evaluate_expression(text: str) -> float:
+    """
+    Safely evaluate a question's arithmetic expression.
+
+    Understands the notation the generators above produce (``+``, ``-``,
+    ``×``, ``÷`` and parentheses) plus ``*`` and ``/``.  Nothing is passed
+    to ``eval``; anything else raises ``ValueError``.
+    """
+    if len(text) > _MAX_EXPRESSION_LENGTH:
+        raise ValueError("Expression too long")
+    tokens = _tokenize(text)
+    pos = 0
+
+    def peek():
+        return tokens[pos] if pos < len(tokens) else None
+
+    def take():
+        nonlocal pos
+        if pos >= len(tokens):
+            raise ValueError("Unexpected end of expression")
+        pos += 1
+        return tokens[pos - 1]
+
+    def expr() -> float:
+        value = term()
+        while peek() in ("+", "-"):
+            if take() == "+":
+                value += term()
+            else:
+                value -= term()
+        return value
+
+    def term() -> float:
+        value = factor()
+        while peek() in ("*", "/"):
+            if take() == "*":
+                value *= factor()
+            else:
+                divisor = factor()
+                if divisor == 0:
+                    raise ValueError("Division by zero")
+                value /= divisor
+        return value
+
+    def factor() -> float:
+        token = take()
+        if token == "-":
+            return -factor()
+        if token == "(":
+            value = expr()
+            if take() != ")":
+                raise ValueError("Expected ')'")
+            return value
+        try:
+            return float(token)
+        except ValueError:
+            raise ValueError(f"Unexpected token {token!r}") from None
+
+    value = expr()
+    if pos != len(tokens):
+        raise ValueError(f"Unexpected token {tokens[pos]!r}")
+    return value
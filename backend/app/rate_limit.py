@@ -0,0 +1,29 @@
+"""Token-bucket rate limiting for WebSocket admission control."""
+
+import time
+
+
+class TokenBucket:
+    """
+    Classic token bucket: holds up to ``burst`` tokens, refilled at ``rate``
+    tokens per second.  Refill is computed lazily on each call, so an idle
+    bucket costs nothing.
+    """
+
+    __slots__ = ("rate", "burst", "tokens", "updated_at")
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+
+    def consume(self, tokens: float = 1.0) -> bool:
+        """Take ``tokens`` from the bucket; return False if there aren't enough."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
@@ -0,0 +1,118 @@
+"""In-process TTL/LRU cache of serialized read responses with ETag support."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable, Optional, Tuple
+
+from fastapi import Request, Response
+
+from app.config import settings
+
+# How long an invalidation is remembered for reads still in flight; a read
+# spanning more than this just skips caching its result
+GENERATION_WINDOW_SECONDS = 1.0
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    etag: str
+    expires_at: float
+
+    def respond(self, request: Request) -> Response:
+        """The cached body, or an empty 304 if the client already has it."""
+        headers = {"ETag": self.etag, "Cache-Control": "no-cache"}
+        if_none_match = request.headers.get("if-none-match", "")
+        if self.etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers=headers)
+        return Response(self.body, media_type="application/json", headers=headers)
+
+
+class ResponseCache:
+    """
+    Bounded LRU of response bodies keyed by ``(kind, id)`` tuples.
+
+    Entries expire after ``ttl`` seconds as a safety net; writers are
+    expected to call :meth:`invalidate` whenever the underlying data changes.
+
+    A reader takes :meth:`generation` before querying on a miss and hands it
+    to :meth:`put`, which then declines to store a body read before an
+    invalidation that landed while the query was awaited.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        # Last invalidation of each recently invalidated key, from one
+        # counter, with its time.  Keys trimmed out count as invalidated at
+        # ``_floor``, so a trim can only make a pending put give up, never
+        # store stale data.
+        self._generations: "OrderedDict[Hashable, Tuple[int, float]]" = OrderedDict()
+        self._counter = 0
+        self._floor = 0
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def generation(self, key: Hashable) -> int:
+        stamp = self._generations.get(key)
+        return stamp[0] if stamp else self._floor
+
+    def put(
+        self, key: Hashable, body: bytes, generation: Optional[int] = None
+    ) -> CachedResponse:
+        """
+        Cache ``body`` and return its entry.  If ``key`` was invalidated since
+        ``generation`` was taken, the entry is returned but not stored.
+        """
+        etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+        entry = CachedResponse(body=body, etag=etag, expires_at=time.monotonic() + self.ttl)
+        if generation is not None and generation != self.generation(key):
+            return entry
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, key: Hashable):
+        self._entries.pop(key, None)
+        self._counter += 1
+        now = time.monotonic()
+        self._generations[key] = (self._counter, now)
+        self._generations.move_to_end(key)
+        # Only reads already in flight need these; the newest is never trimmed
+        cutoff = now - GENERATION_WINDOW_SECONDS
+        generations = self._generations
+        while len(generations) > self.max_entries or next(iter(generations.values()))[1] < cutoff:
+            _, (self._floor, _) = generations.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self._counter += 1
+        self._generations.clear()
+        self._floor = self._counter
+
+
+response_cache = ResponseCache(
+    ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+)
+
+
+def invalidate_room(room_code: str):
+    response_cache.invalidate(("room", room_code))
+
+
+def invalidate_player(user_id: str):
+    response_cache.invalidate(("player", user_id))
@@ -0,0 +1,162 @@
+"""Persisting finished games: match rows, room status and leaderboard stats."""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import async_session
+from app.leaderboard_feed import leaderboard_feed
+from app.lookups import resolve_users, unique_room_codes
+from app.models import GameRoom, LeaderboardStats, Match, Player, generate_uuid
+from app.response_cache import invalidate_player, invalidate_room
+
+logger = logging.getLogger("uvicorn.error")
+
+
+@dataclass
+class PlayerTally:
+    team: str
+    answers: int = 0
+    correct: int = 0
+    correct_response_time_ms: int = 0
+
+
+@dataclass
+class RosterEntry:
+    player_id: str
+    user_id: str  # provisional until an ephemeral room is first persisted
+    username: str
+    team: str
+    joined_at: datetime = field(default_factory=datetime.utcnow)
+
+
+@dataclass
+class RoomSnapshot:
+    """An ephemeral room's settings and roster, written with its first result."""
+
+    difficulty: str
+    max_players_per_team: int
+    win_threshold: int
+    round_duration: int
+    created_at: datetime
+    roster: List[RosterEntry]
+
+
+@dataclass
+class GameResult:
+    room_id: str
+    room_code: str
+    winner: Optional[str]
+    rope_position: int
+    duration: int
+    finished_at: datetime = field(default_factory=datetime.utcnow)
+    players: Dict[str, PlayerTally] = field(default_factory=dict)  # by user_id
+    # Set for an ephemeral room that has no rows yet
+    room: Optional[RoomSnapshot] = None
+
+
+async def _insert_room(db: AsyncSession, result: GameResult) -> Dict[str, str]:
+    """
+    Write an ephemeral room, its users and its players; return a map from
+    provisional to real user ids.  ``result.room_code`` is updated if the
+    code had to be replaced.
+    """
+    room = result.room
+    user_ids = await resolve_users(db, {entry.username for entry in room.roster})
+
+    # Ephemeral codes are only unique among live games
+    room_code = result.room_code
+    if await db.scalar(select(GameRoom.id).where(GameRoom.room_code == room_code)):
+        (room_code,) = await unique_room_codes(db, 1)
+        result.room_code = room_code
+
+    await db.execute(
+        insert(GameRoom).values(
+            id=result.room_id,
+            room_code=room_code,
+            status="finished",
+            difficulty=room.difficulty,
+            max_players_per_team=room.max_players_per_team,
+            win_threshold=room.win_threshold,
+            round_duration=room.round_duration,
+            created_at=room.created_at,
+        )
+    )
+    if room.roster:
+        await db.execute(
+            insert(Player),
+            [
+                {
+                    "id": entry.player_id,
+                    "user_id": user_ids[entry.username],
+                    "room_id": result.room_id,
+                    "team": entry.team,
+                    "joined_at": entry.joined_at,
+                }
+                for entry in room.roster
+            ],
+        )
+    return {entry.user_id: user_ids[entry.username] for entry in room.roster}
+
+
+async def persist_result(result: GameResult) -> Optional[Dict[str, str]]:
+    """
+    Write one finished game in a single transaction, then notify readers.
+
+    Returns the provisional-to-real user id map (empty unless the result
+    carries an ephemeral room), or None if the write failed.
+    """
+    user_ids: Dict[str, str] = {}
+    try:
+        async with async_session() as db:
+            if result.room:
+                user_ids = await _insert_room(db, result)
+                result.players = {
+                    user_ids.get(user_id, user_id): tally
+                    for user_id, tally in result.players.items()
+                }
+            await db.execute(
+                insert(Match).values(
+                    id=generate_uuid(),
+                    room_id=result.room_id,
+                    winner_team=result.winner,
+                    rope_final_position=result.rope_position,
+                    duration=result.duration,
+                    finished_at=result.finished_at,
+                )
+            )
+            if not result.room:
+                await db.execute(
+                    update(GameRoom)
+                    .where(GameRoom.id == result.room_id)
+                    .values(status="finished")
+                )
+            for user_id, tally in result.players.items():
+                won = result.winner is not None and tally.team == result.winner
+                lost = result.winner is not None and tally.team != result.winner
+                await db.execute(
+                    update(LeaderboardStats)
+                    .where(LeaderboardStats.user_id == user_id)
+                    .values(
+                        wins=LeaderboardStats.wins + int(won),
+                        losses=LeaderboardStats.losses + int(lost),
+                        total_answers=LeaderboardStats.total_answers + tally.answers,
+                        correct_answers=LeaderboardStats.correct_answers + tally.correct,
+                        total_response_time_ms=LeaderboardStats.total_response_time_ms
+                        + tally.correct_response_time_ms,
+                    )
+                )
+            await db.commit()
+    except Exception:
+        logger.exception("Failed to persist result of room %s", result.room_id)
+        return None
+
+    invalidate_room(result.room_code)
+    for user_id in result.players:
+        invalidate_player(user_id)
+    leaderboard_feed.mark_dirty()
+    return user_ids
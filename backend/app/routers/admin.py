@@ -1,14 +1,32 @@
 """Admin panel API endpoints."""
 
-from fastapi import APIRouter, Depends
+import codecs
+import csv
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import ValidationError
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.models import Question
-from app.schemas import AdminQuestionCreate, AdminSettingsUpdate
+from app.game_manager import game_manager
+from app.models import Question, generate_uuid
+from app.question_engine import DIFFICULTIES, evaluate_expression
+from app.schemas import (
+    AdminQuestionCreate,
+    AdminSettingsUpdate,
+    QuestionImportResponse,
+    QuestionImportRow,
+)
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
+IMPORT_CHUNK_SIZE = 1000
+IMPORT_MAX_ERRORS = 50
+IMPORT_MAX_LINE_LENGTH = 4096
+CSV_COLUMNS = ("question_text", "answer", "difficulty", "time_limit")
+
 
 @router.post("/questions", response_model=dict)
 async def create_question(req: AdminQuestionCreate, db: AsyncSession = Depends(get_db)):
@@ -26,14 +44,147 @@ async def create_question(req: AdminQuestionCreate, db: AsyncSession = Depends(g
     return {"id": question.id, "message": "Question created successfully"}
 
 
+@router.post("/questions/import", response_model=QuestionImportResponse)
+async def import_questions(
+    request: Request,
+    format: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Stream-import custom questions from a JSONL or CSV request body.
+
+    The body is parsed line by line as it arrives.  Each answer is recomputed
+    from ``question_text``; rows whose given answer disagrees are rejected.
+    Accepted rows are bulk-inserted and committed every ``IMPORT_CHUNK_SIZE``
+    rows, so memory use does not grow with the upload.  CSV bodies need a
+    header row naming the ``CSV_COLUMNS`` they provide.
+    """
+    fmt = (format or "").lower()
+    if not fmt:
+        content_type = request.headers.get("content-type", "")
+        fmt = "csv" if "csv" in content_type else "jsonl"
+    if fmt not in ("jsonl", "csv"):
+        raise HTTPException(status_code=400, detail="format must be 'jsonl' or 'csv'")
+
+    imported = 0
+    rejected = 0
+    errors: List[str] = []
+    batch: List[Dict] = []
+    header: Optional[List[str]] = None
+
+    async for line_no, line in _iter_lines(request):
+        if line is None:
+            rejected += 1
+            if len(errors) < IMPORT_MAX_ERRORS:
+                errors.append(f"line {line_no}: longer than {IMPORT_MAX_LINE_LENGTH} characters")
+            continue
+        if not line.strip():
+            continue
+
+        try:
+            if fmt == "csv":
+                fields = next(csv.reader([line]))
+                if header is None:
+                    header = [f.strip() for f in fields]
+                    unknown = set(header) - set(CSV_COLUMNS)
+                    if unknown or "question_text" not in header:
+                        raise HTTPException(
+                            status_code=400,
+                            detail=f"CSV header must use columns {', '.join(CSV_COLUMNS)}",
+                        )
+                    continue
+                row = QuestionImportRow.model_validate(
+                    {k: v for k, v in zip(header, fields) if v != ""}
+                )
+            else:
+                row = QuestionImportRow.model_validate_json(line)
+            batch.append(_checked_question(row))
+        except (ValidationError, ValueError) as e:
+            rejected += 1
+            if len(errors) < IMPORT_MAX_ERRORS:
+                reason = e.errors()[0]["msg"] if isinstance(e, ValidationError) else str(e)
+                errors.append(f"line {line_no}: {reason}")
+            continue
+
+        if len(batch) >= IMPORT_CHUNK_SIZE:
+            imported += await _insert_questions(db, batch)
+            batch = []
+
+    if batch:
+        imported += await _insert_questions(db, batch)
+
+    return QuestionImportResponse(imported=imported, rejected=rejected, errors=errors)
+
+
+def _checked_question(row: QuestionImportRow) -> Dict:
+    """Verify an import row against its recomputed answer; return an insert dict."""
+    if row.difficulty not in DIFFICULTIES:
+        raise ValueError(f"Invalid difficulty '{row.difficulty}'")
+    if row.time_limit <= 0:
+        raise ValueError("time_limit must be positive")
+
+    try:
+        expected = evaluate_expression(row.question_text)
+    except RecursionError:
+        raise ValueError("Expression too deeply nested") from None
+    if row.answer is not None and abs(row.answer - expected) >= 0.01:
+        raise ValueError(f"Answer {row.answer:g} does not match computed {expected:g}")
+
+    return {
+        "id": generate_uuid(),
+        "question_text": row.question_text,
+        "answer": expected,
+        "difficulty": row.difficulty,
+        "time_limit": row.time_limit,
+        "is_custom": True,
+    }
+
+
+async def _insert_questions(db: AsyncSession, rows: List[Dict]) -> int:
+    await db.execute(insert(Question), rows)
+    await db.commit()
+    return len(rows)
+
+
+async def _iter_lines(request: Request) -> AsyncIterator[Tuple[int, Optional[str]]]:
+    """
+    Yield ``(line_number, line)`` from the request body as chunks arrive.
+
+    A line longer than ``IMPORT_MAX_LINE_LENGTH`` is yielded as ``None``
+    without being buffered, so the caller can reject it and carry on.
+    """
+    # utf-8-sig drops a leading byte-order mark, as spreadsheet exports add
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    too_long = False
+    line_no = 0
+    async for chunk in request.stream():
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            line_no += 1
+            if too_long or len(line) > IMPORT_MAX_LINE_LENGTH:
+                too_long = False
+                yield line_no, None
+            else:
+                yield line_no, line.rstrip("\r")
+        if len(pending) > IMPORT_MAX_LINE_LENGTH:
+            # Drop the rest of this line as it streams in
+            too_long = True
+            pending = ""
+    pending += decoder.decode(b"", final=True)
+    if too_long or len(pending) > IMPORT_MAX_LINE_LENGTH:
+        yield line_no + 1, None
+    elif pending:
+        yield line_no + 1, pending.rstrip("\r")
+
+
 @router.put("/settings", response_model=dict)
 async def update_settings(req: AdminSettingsUpdate):
     """Update default game settings (runtime only — not persisted to DB)."""
-    from app.config import settings
-
     if req.difficulty is not None:
         # Validate difficulty
-        if req.difficulty not in ("easy", "medium", "hard", "extreme"):
+        if req.difficulty not in DIFFICULTIES:
             return {"error": "Invalid difficulty level"}
 
     updated = {}
@@ -45,3 +196,15 @@ async def update_settings(req: AdminSettingsUpdate):
         updated["difficulty"] = req.difficulty
 
     return {"message": "Settings updated", "updated": updated}
+
+
+@router.get("/connections", response_model=dict)
+async def connection_stats():
+    """Live game/socket counts and how many idle sockets have been reaped."""
+    games = list(game_manager.games.values())
+    return {
+        "games": len(games),
+        "connections": sum(len(g.connections) for g in games),
+        "detached": sum(len(g.detached) for g in games),
+        "reaped_connections": game_manager.reaped_connections,
+    }
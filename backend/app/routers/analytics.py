@@ -0,0 +1,31 @@
+"""Answer analytics endpoints backed by the columnar answer store."""
+
+from fastapi import APIRouter, HTTPException
+
+from app.answer_store import answer_store, difficulty_report, player_report, team_report
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+# Plain ``def`` endpoints: FastAPI runs them in its threadpool, so a large
+# scan never blocks the event loop that drives live games.
+
+
+@router.get("/players/{user_id}", response_model=dict)
+def get_player_analytics(user_id: str):
+    """Latency percentiles, accuracy and daily accuracy trend for one player."""
+    report = player_report(answer_store, user_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail="No answers recorded for player")
+    return report
+
+
+@router.get("/difficulties", response_model=dict)
+def get_difficulty_analytics():
+    """Latency percentiles and accuracy per difficulty level."""
+    return difficulty_report(answer_store)
+
+
+@router.get("/teams", response_model=dict)
+def get_team_analytics():
+    """Answer volume, accuracy and latency for Team A vs Team B."""
+    return team_report(answer_store)
@@ -0,0 +1,111 @@
+"""Streaming NDJSON exports of match and player history."""
+
+import json
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, and_, or_, select, true
+
+from app.config import settings
+from app.database import async_session
+from app.models import GameRoom, Match, Player
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+
+def _after(last: Optional[tuple]):
+    """Keyset condition: rows strictly after ``(finished_at, id)``."""
+    if last is None:
+        return true()
+    finished_at, match_id = last
+    return or_(
+        Match.finished_at > finished_at,
+        and_(Match.finished_at == finished_at, Match.id > match_id),
+    )
+
+
+async def _stream_pages(stmt: Select) -> AsyncIterator[str]:
+    """
+    Yield NDJSON lines for ``stmt`` one keyset page at a time.
+
+    Each page runs in its own short session on a server-side cursor, so
+    memory stays flat and no transaction is held open across the export.
+    ``stmt`` must select ``Match.finished_at`` and ``Match.id`` first and
+    be ordered by them.
+    """
+    last = None
+    page_size = settings.EXPORT_PAGE_SIZE
+    while True:
+        count = 0
+        async with async_session() as db:
+            result = await db.stream(
+                stmt.where(_after(last)).limit(page_size),
+                execution_options={"yield_per": page_size},
+            )
+            async for row in result.mappings():
+                count += 1
+                last = (row["finished_at"], row["match_id"])
+                yield json.dumps(dict(row), default=_json_default, separators=(",", ":")) + "\n"
+        if count < page_size:
+            return
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _ndjson(lines: AsyncIterator[str]) -> StreamingResponse:
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+
+@router.get("/matches")
+async def export_matches(since: Optional[datetime] = None):
+    """Stream every finished match, oldest first, optionally from ``since`` on."""
+    stmt = (
+        select(
+            Match.finished_at,
+            Match.id.label("match_id"),
+            Match.room_id,
+            GameRoom.room_code,
+            GameRoom.difficulty,
+            Match.winner_team,
+            Match.rope_final_position,
+            Match.duration,
+        )
+        .join(GameRoom, GameRoom.id == Match.room_id)
+        .where(Match.finished_at.is_not(None))
+        .order_by(Match.finished_at, Match.id)
+    )
+    if since is not None:
+        stmt = stmt.where(Match.finished_at >= since)
+    return _ndjson(_stream_pages(stmt))
+
+
+@router.get("/users/{user_id}/games")
+async def export_user_games(user_id: str, since: Optional[datetime] = None):
+    """Stream a user's finished games with their team and result, oldest first."""
+    stmt = (
+        select(
+            Match.finished_at,
+            Match.id.label("match_id"),
+            Match.room_id,
+            GameRoom.room_code,
+            GameRoom.difficulty,
+            Player.id.label("player_id"),
+            Player.team,
+            Match.winner_team,
+            Match.rope_final_position,
+            Match.duration,
+        )
+        .join(Match, Match.room_id == Player.room_id)
+        .join(GameRoom, GameRoom.id == Player.room_id)
+        .where(Player.user_id == user_id, Match.finished_at.is_not(None))
+        .order_by(Match.finished_at, Match.id)
+    )
+    if since is not None:
+        stmt = stmt.where(Match.finished_at >= since)
+    return _ndjson(_stream_pages(stmt))
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, WebSocket, WebSocketDisconnect
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.database import get_db
+from app.leaderboard_feed import leaderboard_feed, top_entries
 from app.models import LeaderboardStats, User
+from app.response_cache import response_cache
 from app.schemas import LeaderboardEntry, PlayerStatsResponse
 
 router = APIRouter(tags=["leaderboard"])
@@ -17,30 +19,33 @@ router = APIRouter(tags=["leaderboard"])
 @router.get("/leaderboard", response_model=list[LeaderboardEntry])
 async def get_leaderboard(limit: int = 20, db: AsyncSession = Depends(get_db)):
     """Get top players ranked by wins."""
-    result = await db.execute(
-        select(LeaderboardStats)
-        .options(selectinload(LeaderboardStats.user))
-        .order_by(LeaderboardStats.wins.desc())
-        .limit(limit)
-    )
-    stats_list = result.scalars().all()
+    return await top_entries(db, limit)
 
-    return [
-        LeaderboardEntry(
-            rank=i + 1,
-            username=s.user.username,
-            wins=s.wins,
-            losses=s.losses,
-            accuracy=s.accuracy,
-            avg_response_time_ms=s.avg_response_time_ms,
-        )
-        for i, s in enumerate(stats_list)
-    ]
+
+@router.websocket("/ws/leaderboard")
+async def leaderboard_websocket(websocket: WebSocket):
+    """
+    Live leaderboard: a ``leaderboard_snapshot`` on connect, then at most one
+    ``leaderboard_diff`` per push interval while stats are changing.
+    """
+    await leaderboard_feed.subscribe(websocket)
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        leaderboard_feed.unsubscribe(websocket)
 
 
 @router.get("/player/{user_id}", response_model=PlayerStatsResponse)
-async def get_player_stats(user_id: str, db: AsyncSession = Depends(get_db)):
-    """Get individual player statistics."""
+async def get_player_stats(user_id: str, request: Request, db: AsyncSession = Depends(get_db)):
+    """Get individual player statistics (cached, ETag-aware)."""
+    cached = response_cache.get(("player", user_id))
+    if cached:
+        return cached.respond(request)
+    generation = response_cache.generation(("player", user_id))
+
     result = await db.execute(
         select(LeaderboardStats)
         .where(LeaderboardStats.user_id == user_id)
@@ -50,7 +55,7 @@ async def get_player_stats(user_id: str, db: AsyncSession = Depends(get_db)):
     if not stats:
         raise HTTPException(status_code=404, detail="Player not found")
 
-    return PlayerStatsResponse(
+    response = PlayerStatsResponse(
         username=stats.user.username,
         wins=stats.wins,
         losses=stats.losses,
@@ -59,3 +64,7 @@ async def get_player_stats(user_id: str, db: AsyncSession = Depends(get_db)):
         accuracy=stats.accuracy,
         avg_response_time_ms=stats.avg_response_time_ms,
     )
+    entry = response_cache.put(
+        ("player", user_id), response.model_dump_json().encode(), generation
+    )
+    return entry.respond(request)
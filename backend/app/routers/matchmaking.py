@@ -0,0 +1,67 @@
+"""Matchmaking endpoints."""
+
+import asyncio
+
+from fastapi import APIRouter, HTTPException
+
+from app.matchmaking import Ticket, matchmaker
+from app.schemas import MatchmakingRequest, MatchmakingTicketResponse
+
+router = APIRouter(prefix="/matchmaking", tags=["matchmaking"])
+
+MAX_WAIT_SECONDS = 30.0
+
+
+def _ticket_response(ticket: Ticket) -> MatchmakingTicketResponse:
+    response = MatchmakingTicketResponse(
+        ticket_id=ticket.id,
+        status=ticket.status,
+        difficulty=ticket.difficulty,
+    )
+    if ticket.room and ticket.player:
+        response.room_id = ticket.room.room_id
+        response.room_code = ticket.room.room_code
+        response.player_id = ticket.player.player_id
+        response.user_id = ticket.player.user_id
+        response.team = ticket.player.team
+    return response
+
+
+@router.post("/queue", response_model=MatchmakingTicketResponse)
+async def enqueue(req: MatchmakingRequest):
+    """Join the matchmaking queue for a difficulty; returns a ticket to poll."""
+    try:
+        ticket = matchmaker.enqueue(req.username, req.difficulty)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _ticket_response(ticket)
+
+
+@router.get("/tickets/{ticket_id}", response_model=MatchmakingTicketResponse)
+async def get_ticket(ticket_id: str, wait: float = 0):
+    """
+    Get a ticket's status.  With ``wait`` (seconds, max 30) this long-polls
+    until the ticket is matched or cancelled.
+    """
+    ticket = matchmaker.get(ticket_id)
+    if not ticket:
+        raise HTTPException(status_code=404, detail="Ticket not found")
+
+    if wait > 0 and ticket.status in ("queued", "matching"):
+        try:
+            await asyncio.wait_for(ticket.done.wait(), min(wait, MAX_WAIT_SECONDS))
+        except asyncio.TimeoutError:
+            pass
+
+    return _ticket_response(ticket)
+
+
+@router.delete("/tickets/{ticket_id}", response_model=MatchmakingTicketResponse)
+async def cancel_ticket(ticket_id: str):
+    """Leave the queue."""
+    ticket = matchmaker.cancel(ticket_id)
+    if not ticket:
+        raise HTTPException(status_code=404, detail="Ticket not found")
+    if ticket.status == "matching":
+        raise HTTPException(status_code=409, detail="Ticket is already being matched")
+    return _ticket_response(ticket)
@@ -0,0 +1,41 @@
+"""On-demand sampling profiler for the live server."""
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from app.profiler import collapsed, profiler
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+PROFILE_MAX_SECONDS = 60
+PROFILE_MIN_INTERVAL_MS = 1
+PROFILE_MAX_INTERVAL_MS = 1000
+
+
+@router.post("/profile", response_class=PlainTextResponse)
+async def run_profile(seconds: float = 10.0, interval_ms: float = 5.0):
+    """
+    Sample every thread's stack for ``seconds`` and return collapsed stacks.
+
+    The output feeds straight into ``flamegraph.pl`` or speedscope.  Event
+    loop stacks are rooted at the HTTP route, WebSocket message type and
+    room, or background task that was running.  Sampling happens in a helper
+    thread, so the server keeps serving throughout; only one run may be
+    active at a time.
+    """
+    if not 0 < seconds <= PROFILE_MAX_SECONDS:
+        raise HTTPException(
+            status_code=400, detail=f"seconds must be in (0, {PROFILE_MAX_SECONDS}]"
+        )
+    if not PROFILE_MIN_INTERVAL_MS <= interval_ms <= PROFILE_MAX_INTERVAL_MS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"interval_ms must be in [{PROFILE_MIN_INTERVAL_MS}, {PROFILE_MAX_INTERVAL_MS}]",
+        )
+    if not profiler.acquire():
+        raise HTTPException(status_code=409, detail="A profile is already running")
+
+    stacks = await profiler.run(seconds, interval_ms / 1000)
+    return PlainTextResponse(
+        collapsed(stacks), headers={"X-Profile-Samples": str(sum(stacks.values()))}
+    )
@@ -0,0 +1,36 @@
+"""Replay endpoints for finished matches."""
+
+import json
+import os
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+
+from app.event_log import iter_events, log_path
+from app.game_manager import game_manager
+
+router = APIRouter(prefix="/replay", tags=["replay"])
+
+
+@router.get("/{room_id}")
+async def replay_match(room_id: str):
+    """Stream a finished match's recorded events as NDJSON."""
+    try:
+        path = log_path(room_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Replay not found")
+
+    game = game_manager.get_game(room_id)
+    if game and game.status == "in_progress":
+        raise HTTPException(status_code=409, detail="Match still in progress")
+
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="Replay not found")
+
+    def lines():
+        for event in iter_events(path):
+            # The seed would let anyone compute the room's upcoming questions
+            event.pop("seed", None)
+            yield json.dumps(event, separators=(",", ":")) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
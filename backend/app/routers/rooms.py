@@ -2,34 +2,43 @@
 
 from __future__ import annotations
 
-import random
-import string
-
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.database import get_db
-from app.game_manager import game_manager
+from app.game_manager import ActiveGame, game_manager
+from app.lookups import generate_room_code
 from app.models import GameRoom, LeaderboardStats, Player, User
-from app.schemas import CreateRoomRequest, JoinRoomRequest, JoinRoomResponse, RoomResponse
+from app.provisioning import provision_rooms
+from app.response_cache import invalidate_room, response_cache
+from app.schemas import (
+    BulkCreateRoomsRequest,
+    BulkCreateRoomsResponse,
+    CreateRoomRequest,
+    JoinRoomRequest,
+    JoinRoomResponse,
+    RoomResponse,
+)
 
 router = APIRouter(prefix="/rooms", tags=["rooms"])
 
 
-def _generate_room_code(length: int = 6) -> str:
-    return "".join(random.choices(string.ascii_uppercase + string.digits, k=length))
-
-
 @router.post("", response_model=JoinRoomResponse)
 async def create_room(req: CreateRoomRequest, db: AsyncSession = Depends(get_db)):
     """Create a new game room and auto-join the creator as Team A."""
+    if not game_manager.has_capacity():
+        raise HTTPException(status_code=503, detail="Server is at room capacity")
+
+    if req.ephemeral:
+        return _create_ephemeral_room(req)
+
     # Find or create user
     user = await _get_or_create_user(db, req.username)
 
     # Create room
-    room_code = _generate_room_code()
+    room_code = generate_room_code()
     room = GameRoom(
         room_code=room_code,
         difficulty=req.difficulty,
@@ -46,13 +55,16 @@ async def create_room(req: CreateRoomRequest, db: AsyncSession = Depends(get_db)
     await db.commit()
 
     # Create in-memory game
-    game_manager.create_game(
+    game = game_manager.create_game(
         room_id=room.id,
         room_code=room_code,
         difficulty=req.difficulty,
         win_threshold=req.win_threshold,
         round_duration=req.round_duration,
+        series_length=req.series_length,
+        max_players_per_team=req.max_players_per_team,
     )
+    game_manager.add_player(game, player.id, user.id, user.username, "A")
 
     return JoinRoomResponse(
         room_id=room.id,
@@ -64,9 +76,57 @@ async def create_room(req: CreateRoomRequest, db: AsyncSession = Depends(get_db)
     )
 
 
+def _create_ephemeral_room(req: CreateRoomRequest) -> JoinRoomResponse:
+    """Create a room held only in memory; nothing touches the DB."""
+    room_code = generate_room_code()
+    while room_code in game_manager.codes:
+        room_code = generate_room_code()
+
+    game = game_manager.create_ephemeral_game(
+        room_code=room_code,
+        difficulty=req.difficulty,
+        max_players_per_team=req.max_players_per_team,
+        win_threshold=req.win_threshold,
+        round_duration=req.round_duration,
+        series_length=req.series_length,
+    )
+    entry = game_manager.join_ephemeral(game, req.username, "A")
+    return JoinRoomResponse(
+        room_id=game.room_id,
+        room_code=room_code,
+        player_id=entry.player_id,
+        user_id=entry.user_id,
+        team=entry.team,
+        status=game.status,
+    )
+
+
+@router.post("/bulk", response_model=BulkCreateRoomsResponse)
+async def create_rooms_bulk(req: BulkCreateRoomsRequest, db: AsyncSession = Depends(get_db)):
+    """Provision many rooms with pre-assigned rosters in one transaction."""
+    if not game_manager.has_capacity(len(req.rooms)):
+        raise HTTPException(status_code=503, detail="Server is at room capacity")
+
+    try:
+        rooms = await provision_rooms(db, req.rooms)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return BulkCreateRoomsResponse(rooms=rooms)
+
+
 @router.get("/{room_code}", response_model=RoomResponse)
-async def get_room(room_code: str, db: AsyncSession = Depends(get_db)):
-    """Get room details by room code."""
+async def get_room(room_code: str, request: Request, db: AsyncSession = Depends(get_db)):
+    """Get room details by room code (cached, ETag-aware)."""
+    game = game_manager.get_game_by_code(room_code)
+    if game and game.ephemeral:
+        return _ephemeral_room_response(game)
+
+    cached = response_cache.get(("room", room_code))
+    if cached:
+        return cached.respond(request)
+    generation = response_cache.generation(("room", room_code))
+
     result = await db.execute(
         select(GameRoom)
         .where(GameRoom.room_code == room_code)
@@ -79,7 +139,7 @@ async def get_room(room_code: str, db: AsyncSession = Depends(get_db)):
     team_a = sum(1 for p in room.players if p.team == "A")
     team_b = sum(1 for p in room.players if p.team == "B")
 
-    return RoomResponse(
+    response = RoomResponse(
         room_id=room.id,
         room_code=room.room_code,
         status=room.status,
@@ -90,11 +150,45 @@ async def get_room(room_code: str, db: AsyncSession = Depends(get_db)):
         team_a_count=team_a,
         team_b_count=team_b,
     )
+    entry = response_cache.put(
+        ("room", room_code), response.model_dump_json().encode(), generation
+    )
+    return entry.respond(request)
+
+
+def _ephemeral_room_response(game: ActiveGame) -> RoomResponse:
+    team_a = sum(1 for e in game.roster.values() if e.team == "A")
+    return RoomResponse(
+        room_id=game.room_id,
+        room_code=game.room_code,
+        status=game.status,
+        difficulty=game.difficulty,
+        max_players_per_team=game.max_players_per_team,
+        win_threshold=game.win_threshold,
+        round_duration=game.round_duration,
+        team_a_count=team_a,
+        team_b_count=len(game.roster) - team_a,
+    )
 
 
 @router.post("/{room_code}/join", response_model=JoinRoomResponse)
 async def join_room(room_code: str, req: JoinRoomRequest, db: AsyncSession = Depends(get_db)):
     """Join an existing game room."""
+    game = game_manager.get_game_by_code(room_code)
+    if game and game.ephemeral:
+        try:
+            entry = game_manager.join_ephemeral(game, req.username, req.team)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return JoinRoomResponse(
+            room_id=game.room_id,
+            room_code=game.room_code,
+            player_id=entry.player_id,
+            user_id=entry.user_id,
+            team=entry.team,
+            status=game.status,
+        )
+
     result = await db.execute(
         select(GameRoom)
         .where(GameRoom.room_code == room_code)
@@ -146,6 +240,11 @@ async def join_room(room_code: str, req: JoinRoomRequest, db: AsyncSession = Dep
     player = Player(user_id=user.id, room_id=room.id, team=team)
     db.add(player)
     await db.commit()
+    invalidate_room(room.room_code)
+
+    game = game_manager.get_game(room.id)
+    if game:
+        game_manager.add_player(game, player.id, user.id, user.username, team)
 
     return JoinRoomResponse(
         room_id=room.id,
@@ -1,57 +1,174 @@
 """WebSocket endpoint for real-time game communication."""
 
 import json
+import time
+from typing import Optional
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
-from app.game_manager import game_manager
+from app.config import settings
+from app.database import async_session
+from app.game_manager import ActiveGame, game_manager
+from app.latency import as_ms, loop_lag, ping_message
+from app.profiler import profiler
+from app.provisioning import restore_game
+from app.rate_limit import TokenBucket
 
 router = APIRouter(tags=["websocket"])
 
+# Close codes (RFC 6455 §7.4.1)
+CLOSE_POLICY_VIOLATION = 1008
+CLOSE_MESSAGE_TOO_BIG = 1009
+CLOSE_TRY_AGAIN_LATER = 1013
+
+_KNOWN_MESSAGE_TYPES = ("start_game", "rematch", "answer", "pong")
+
+_active_connections = 0
+
 
 @router.websocket("/ws/game/{room_id}")
 async def game_websocket(websocket: WebSocket, room_id: str):
     """
     WebSocket endpoint for real-time game play.
 
-    Expected query params: player_id, user_id, username, team
+    Expected query params: player_id (from create/join; the player's
+    identity and team come from the room's roster), and optionally
+    resume_from (last ``seq`` received) when reconnecting.
     """
+    global _active_connections
+
     params = websocket.query_params
     player_id = params.get("player_id", "")
-    user_id = params.get("user_id", "")
-    username = params.get("username", "Player")
-    team = params.get("team", "A")
+    resume_from = params.get("resume_from")
+    resume_from = int(resume_from) if resume_from and resume_from.isdigit() else None
 
     game = game_manager.get_game(room_id)
     if not game:
-        await websocket.close(code=4004, reason="Game not found")
+        # Reaped while idle, e.g. a pre-provisioned room nobody joined yet
+        async with async_session() as db:
+            game = await restore_game(db, room_id)
+    if not game:
+        await _reject(websocket, 4004, "Game not found")
+        return
+    if player_id not in game.roster:
+        await _reject(websocket, 4003, "Not a player in this room")
+        return
+
+    if _active_connections >= settings.MAX_WS_CONNECTIONS:
+        await _reject(websocket, CLOSE_TRY_AGAIN_LATER, "Server busy")
         return
 
-    await game_manager.connect_player(
+    _active_connections += 1
+    try:
+        await _serve_player(websocket, game, room_id, player_id, resume_from)
+    finally:
+        _active_connections -= 1
+
+
+async def _reject(websocket: WebSocket, code: int, reason: str):
+    """
+    Close with ``code`` after accepting: a close before the handshake is a
+    plain HTTP 403, which browsers report as 1006 and clients would retry.
+    """
+    await websocket.accept()
+    await websocket.close(code=code, reason=reason)
+
+
+async def _serve_player(
+    websocket: WebSocket,
+    game: ActiveGame,
+    room_id: str,
+    player_id: str,
+    resume_from: Optional[int],
+):
+    """Run the receive loop for one player, dropping frames that fail admission."""
+    conn_bucket = TokenBucket(settings.WS_CONNECTION_RATE, settings.WS_CONNECTION_BURST)
+    # Rejected frames drain this bucket; it refills at one frame per second
+    strikes = TokenBucket(1.0, settings.WS_MAX_VIOLATIONS)
+
+    conn = await game_manager.connect_player(
         room_id=room_id,
         websocket=websocket,
         player_id=player_id,
-        user_id=user_id,
-        username=username,
-        team=team,
+        resume_from=resume_from,
     )
+    if conn is None:
+        return
 
     try:
+        # Start the clock estimate now rather than at the first heartbeat
+        await websocket.send_json(ping_message())
+
         while True:
             data = await websocket.receive_text()
-            message = json.loads(data)
-            msg_type = message.get("type", "")
+            # Back-date the receipt by the loop's lag: the frame sat in the
+            # transport while the loop was busy, which is server-side queueing
+            conn.last_seen = time.monotonic()
+            received_at = conn.last_seen - loop_lag.lag_ms / 1000
+
+            # Cheap checks first: size, then rate, then shape — before json.loads
+            if len(data) > settings.WS_MAX_FRAME_BYTES:
+                await websocket.close(code=CLOSE_MESSAGE_TOO_BIG, reason="Frame too large")
+                break
+
+            message = None
+            if not conn_bucket.consume():
+                pass  # over this connection's own rate: a strike below
+            elif not game.rate_bucket.consume():
+                # The room as a whole is over budget; drop the frame without
+                # charging this sender, and tell them so they can retry
+                try:
+                    await websocket.send_json({"type": "throttled", "data": {}})
+                except Exception:
+                    pass
+                continue
+            elif data[:1] == "{":
+                try:
+                    message = json.loads(data)
+                except ValueError:
+                    pass
+
+            # Strikes: only own-rate overruns and malformed or unknown frames
+            msg_type = message.get("type") if isinstance(message, dict) else None
+            if msg_type not in _KNOWN_MESSAGE_TYPES:
+                if not strikes.consume():
+                    await websocket.close(
+                        code=CLOSE_POLICY_VIOLATION, reason="Too many rejected frames"
+                    )
+                    break
+                continue
+
+            if profiler.running:
+                profiler.tag(("WS", msg_type, f"room={room_id}"))
 
             if msg_type == "start_game":
                 await game_manager.start_game(room_id)
 
+            elif msg_type == "rematch":
+                await game_manager.rematch(room_id)
+
+            elif msg_type == "pong":
+                pong_data = message.get("data")
+                if isinstance(pong_data, dict):
+                    sent_ms = as_ms(pong_data.get("server_time"))
+                    if sent_ms is not None:
+                        conn.clock.observe(
+                            sent_ms, as_ms(pong_data.get("client_time")), received_at * 1000
+                        )
+
             elif msg_type == "answer":
                 answer_data = message.get("data", {})
+                try:
+                    answer = float(answer_data.get("answer", 0))
+                except (TypeError, ValueError, AttributeError):
+                    continue
                 result = await game_manager.submit_answer(
                     room_id=room_id,
                     player_id=player_id,
                     question_id=answer_data.get("question_id", ""),
-                    answer=float(answer_data.get("answer", 0)),
+                    answer=answer,
+                    received_at=received_at,
+                    client_time=as_ms(answer_data.get("client_time")),
                 )
                 # Send result to the submitting player only
                 try:
@@ -61,7 +178,7 @@ async def game_websocket(websocket: WebSocket, room_id: str):
                 except Exception:
                     pass
 
-    except WebSocketDisconnect:
-        await game_manager.disconnect_player(room_id, player_id)
-    except Exception:
-        await game_manager.disconnect_player(room_id, player_id)
+    except (WebSocketDisconnect, Exception):
+        pass
+
+    await game_manager.disconnect_player(room_id, player_id, websocket)
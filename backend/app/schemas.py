@@ -13,6 +13,8 @@ class CreateRoomRequest(BaseModel):
     max_players_per_team: int = 5
     win_threshold: int = 10
     round_duration: int = 120
+    series_length: int = 1  # best-of-N rounds
+    ephemeral: bool = False  # in-memory only until a game completes
 
 
 class JoinRoomRequest(BaseModel):
@@ -42,6 +44,61 @@ class JoinRoomResponse(BaseModel):
     status: str
 
 
+class BulkRosterEntry(BaseModel):
+    username: str
+    team: Optional[str] = None  # Auto-assign if None
+
+
+class BulkRoomSpec(BaseModel):
+    difficulty: str = "easy"
+    max_players_per_team: int = 5
+    win_threshold: int = 10
+    round_duration: int = 120
+    series_length: int = 1
+    roster: List[BulkRosterEntry] = []
+
+
+class BulkCreateRoomsRequest(BaseModel):
+    rooms: List[BulkRoomSpec]
+
+
+class BulkPlayerResponse(BaseModel):
+    username: str
+    player_id: str
+    user_id: str
+    team: str
+
+
+class BulkRoomResponse(BaseModel):
+    room_id: str
+    room_code: str
+    difficulty: str
+    status: str
+    players: List[BulkPlayerResponse] = []
+
+
+class BulkCreateRoomsResponse(BaseModel):
+    rooms: List[BulkRoomResponse]
+
+
+# ── Matchmaking Schemas ───────────────────────────────────────────────
+
+class MatchmakingRequest(BaseModel):
+    username: str
+    difficulty: str = "easy"
+
+
+class MatchmakingTicketResponse(BaseModel):
+    ticket_id: str
+    status: str  # queued, matching, matched, cancelled
+    difficulty: str
+    room_id: Optional[str] = None
+    room_code: Optional[str] = None
+    player_id: Optional[str] = None
+    user_id: Optional[str] = None
+    team: Optional[str] = None
+
+
 # ── Question Schemas ──────────────────────────────────────────────────
 
 class QuestionResponse(BaseModel):
@@ -67,6 +124,10 @@ class GameStateResponse(BaseModel):
     current_question: Optional[QuestionResponse] = None
     status: str = "waiting"  # waiting, in_progress, finished
     winner: Optional[str] = None
+    round_number: int = 0
+    series_length: int = 1
+    series_wins: Dict[str, int] = {}
+    series_winner: Optional[str] = None
 
 
 # ── Leaderboard Schemas ──────────────────────────────────────────────
@@ -99,6 +160,19 @@ class AdminQuestionCreate(BaseModel):
     time_limit: int = 10
 
 
+class QuestionImportRow(BaseModel):
+    question_text: str
+    answer: Optional[float] = None  # Computed from question_text if omitted
+    difficulty: str = "easy"
+    time_limit: int = 10
+
+
+class QuestionImportResponse(BaseModel):
+    imported: int
+    rejected: int
+    errors: List[str] = []  # First few rejections, as "line N: reason"
+
+
 class AdminSettingsUpdate(BaseModel):
     difficulty: Optional[str] = None
     round_duration: Optional[int] = None
@@ -0,0 +1,179 @@
+"""
+In-process soak test for game lifecycles, with tracemalloc leak detection.
+
+Runs many complete rooms (create, connect, play, finish, disconnect) against
+the real ``GameManager`` using fake sockets, snapshots the heap at intervals
+and fails if memory retained per lifecycle exceeds a budget::
+
+    python -m app.soak --cycles 20000 --budget 64
+"""
+
+import argparse
+import asyncio
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from typing import List, Optional
+
+from app.answer_store import answer_store
+from app.config import settings
+from app.game_manager import GameManager
+from app.lookups import generate_room_code
+
+
+class FakeWebSocket:
+    """Just enough of ``starlette.websockets.WebSocket`` for GameManager."""
+
+    def __init__(self):
+        self.sent = 0
+        self.closed = False
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, message):
+        if self.closed:
+            raise RuntimeError("Socket closed")
+        self.sent += 1
+
+    async def send_text(self, data):
+        await self.send_json(data)
+
+    async def close(self, code: int = 1000, reason: Optional[str] = None):
+        self.closed = True
+
+
+async def run_cycle(manager: GameManager, players_per_team: int):
+    """One full room lifecycle; Team A answers every question correctly."""
+    # Plus a room nobody ever joins, which only idle reaping can clean up
+    manager.create_game(str(uuid.uuid4()), generate_room_code())
+
+    room_id = str(uuid.uuid4())
+    game = manager.create_game(room_id, generate_room_code(), win_threshold=5)
+
+    players = []
+    for i in range(2 * players_per_team):
+        player_id = str(uuid.uuid4())
+        team = "A" if i % 2 == 0 else "B"
+        manager.add_player(game, player_id, str(uuid.uuid4()), f"soak{i}", team)
+        await manager.connect_player(room_id, FakeWebSocket(), player_id)
+        players.append((player_id, team))
+
+    await manager.start_game(room_id)
+    scorer = next(pid for pid, team in players if team == "A")
+    while game.status == "in_progress":
+        # A wrong answer from Team B, then the right one from Team A
+        loser = next(pid for pid, team in players if team == "B")
+        await manager.submit_answer(
+            room_id, loser, game.current_question.id, game.current_answer + 1
+        )
+        await manager.submit_answer(
+            room_id, scorer, game.current_question.id, game.current_answer
+        )
+
+    for player_id, _ in players:
+        await manager.disconnect_player(room_id, player_id)
+    # Let grace-period expiry and cancelled timer tasks run to completion
+    for _ in range(3):
+        await asyncio.sleep(0)
+    manager.reap_idle_games(0)
+
+
+def _top_growth(baseline: tracemalloc.Snapshot, top: int) -> List[str]:
+    """Allocation sites (or stacks, with --frames > 1) that grew the most."""
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        (tracemalloc.Filter(False, tracemalloc.__file__),)
+    )
+    key = "traceback" if tracemalloc.get_traceback_limit() > 1 else "lineno"
+    stats = snapshot.compare_to(baseline, key)
+    return [str(stat) for stat in stats[:top] if stat.size_diff > 0]
+
+
+async def soak(
+    cycles: int,
+    players_per_team: int,
+    interval: int,
+    warmup: int,
+    budget: float,
+    top: int,
+    frames: int,
+) -> bool:
+    manager = GameManager()
+
+    for _ in range(warmup):
+        await run_cycle(manager, players_per_team)
+
+    gc.collect()
+    tracemalloc.start(frames)
+    baseline = tracemalloc.take_snapshot()
+    base_size, _ = tracemalloc.get_traced_memory()
+    started = time.perf_counter()
+
+    per_cycle = 0.0
+    for done in range(1, cycles + 1):
+        await run_cycle(manager, players_per_team)
+        if done % interval == 0 or done == cycles:
+            gc.collect()
+            current, peak = tracemalloc.get_traced_memory()
+            per_cycle = (current - base_size) / done
+            rate = done / (time.perf_counter() - started)
+            print(
+                f"[{done}/{cycles}] retained {current - base_size:+,} B "
+                f"({per_cycle:+.1f} B/cycle), peak {peak:,} B, "
+                f"{len(manager.games)} live games, {rate:.0f} cycles/s"
+            )
+
+    print(f"\nTop growth by allocation site since baseline ({cycles} cycles):")
+    for line in _top_growth(baseline, top):
+        print(f"  {line}")
+    tracemalloc.stop()
+
+    if manager.games:
+        print(f"\nFAIL: {len(manager.games)} games never removed")
+        return False
+    if per_cycle > budget:
+        print(f"\nFAIL: {per_cycle:.1f} B retained per cycle exceeds budget of {budget} B")
+        return False
+    print(f"\nOK: {per_cycle:.1f} B retained per cycle (budget {budget} B)")
+    return True
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--cycles", type=int, default=20000)
+    parser.add_argument("--players-per-team", type=int, default=2)
+    parser.add_argument("--interval", type=int, default=2000, help="cycles between snapshots")
+    parser.add_argument("--warmup", type=int, default=200, help="untraced cycles first")
+    parser.add_argument("--budget", type=float, default=64.0, help="max bytes retained per cycle")
+    parser.add_argument("--top", type=int, default=10, help="allocation sites to report")
+    parser.add_argument(
+        "--frames", type=int, default=1, help="stack depth per allocation (slower if > 1)"
+    )
+    args = parser.parse_args(argv)
+
+    # Sockets drop for good here, results skip the DB, and on-disk stores
+    # go to a scratch dir
+    settings.WS_RECONNECT_GRACE_SECONDS = 0
+    settings.PERSIST_RESULTS = False
+    with tempfile.TemporaryDirectory() as scratch:
+        settings.EVENT_LOG_DIR = scratch
+        answer_store.directory = scratch
+        ok = asyncio.run(
+            soak(
+                args.cycles,
+                args.players_per_team,
+                args.interval,
+                args.warmup,
+                args.budget,
+                args.top,
+                args.frames,
+            )
+        )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""Startup warm-up and readiness tracking."""
+
+import asyncio
+import logging
+import time
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from sqlalchemy import text
+
+from app import PROCESS_STARTED_AT
+from app.answer_store import answer_store
+from app.config import settings
+from app.database import engine
+from app.question_engine import DIFFICULTIES, evaluate_expression, generate_question
+from app.schemas import (
+    GameStateResponse,
+    JoinRoomResponse,
+    LeaderboardEntry,
+    PlayerStatsResponse,
+    RoomResponse,
+)
+
+logger = logging.getLogger("uvicorn.error")
+
+
+@dataclass
+class Readiness:
+    ready: bool = False
+    cold_start_ms: Optional[float] = None  # first app import → ready
+    warmup_ms: Optional[float] = None
+    first_request_ms: Optional[float] = None
+    steps_ms: Dict[str, float] = field(default_factory=dict)
+
+    def report(self) -> Dict:
+        return {
+            "status": "ready" if self.ready else "warming",
+            "cold_start_ms": self.cold_start_ms,
+            "warmup_ms": self.warmup_ms,
+            "first_request_ms": self.first_request_ms,
+            "steps_ms": self.steps_ms,
+        }
+
+
+readiness = Readiness()
+
+
+def _ms(since: float) -> float:
+    return round((time.perf_counter() - since) * 1000, 2)
+
+
+async def _warm_pool():
+    """Open pooled connections up front so first requests don't pay for them."""
+    # Hold every connection until all are open, so the pool actually grows
+    async with AsyncExitStack() as stack:
+        for _ in range(settings.DB_POOL_WARM_CONNECTIONS):
+            conn = await stack.enter_async_context(engine.connect())
+            await conn.execute(text("SELECT 1"))
+
+
+async def _warm_tables():
+    """Pull the hot tables' first pages and indexes into SQLite's page cache."""
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT difficulty, COUNT(*) FROM questions GROUP BY difficulty"))
+        await conn.execute(text("SELECT id FROM game_rooms ORDER BY room_code LIMIT 1"))
+        await conn.execute(text("SELECT id FROM users ORDER BY username LIMIT 1"))
+        await conn.execute(text("SELECT wins FROM leaderboard_stats ORDER BY wins DESC LIMIT 1"))
+
+
+def _warm_serializers():
+    """Exercise the hot-path generators and response schemas once."""
+    for difficulty in DIFFICULTIES:
+        question, _ = generate_question(difficulty)
+        evaluate_expression(question.question)
+        GameStateResponse(current_question=question, status="in_progress").model_dump()
+
+    samples = (
+        RoomResponse(
+            room_id="",
+            room_code="",
+            status="waiting",
+            difficulty="easy",
+            max_players_per_team=5,
+            win_threshold=10,
+            round_duration=120,
+        ),
+        JoinRoomResponse(
+            room_id="",
+            room_code="",
+            player_id="",
+            user_id="",
+            team="A",
+            status="waiting",
+        ),
+        LeaderboardEntry(
+            rank=1,
+            username="",
+            wins=0,
+            losses=0,
+            accuracy=0.0,
+            avg_response_time_ms=0.0,
+        ),
+        PlayerStatsResponse(
+            username="",
+            wins=0,
+            losses=0,
+            total_answers=0,
+            correct_answers=0,
+            accuracy=0.0,
+            avg_response_time_ms=0.0,
+        ),
+    )
+    for sample in samples:
+        type(sample).model_validate(sample.model_dump())
+        sample.model_dump_json()
+
+
+def _warm_caches():
+    """Map the answer store columns so the first analytics query skips it."""
+    answer_store.columns()
+
+
+async def warm_up():
+    """Run every warm-up step, record their timings and flip readiness."""
+    started = time.perf_counter()
+    steps = (
+        ("db_pool", _warm_pool),
+        ("tables", _warm_tables),
+        ("serializers", lambda: asyncio.to_thread(_warm_serializers)),
+        ("caches", lambda: asyncio.to_thread(_warm_caches)),
+    )
+    for name, step in steps:
+        step_started = time.perf_counter()
+        try:
+            await step()
+        except Exception:
+            logger.exception("Warm-up step %s failed", name)
+        readiness.steps_ms[name] = _ms(step_started)
+
+    readiness.warmup_ms = _ms(started)
+    readiness.cold_start_ms = _ms(PROCESS_STARTED_AT)
+    readiness.ready = True
+    logger.info(
+        "Ready in %.1f ms (warm-up %.1f ms: %s)",
+        readiness.cold_start_ms,
+        readiness.warmup_ms,
+        ", ".join(f"{k} {v:.1f} ms" for k, v in readiness.steps_ms.items()),
+    )
+
+
+PROBE_PATHS = ("/health", "/ready")
+
+
+class FirstRequestTimer:
+    """ASGI middleware that times the first real HTTP request, then steps aside."""
+
+    def __init__(self, app):
+        self.app = app
+        self.timed = False
+
+    async def __call__(self, scope, receive, send):
+        if self.timed or scope["type"] != "http" or scope["path"] in PROBE_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        self.timed = True
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            readiness.first_request_ms = _ms(started)
+            logger.info(
+                "First request %s took %.1f ms", scope.get("path"), readiness.first_request_ms
+            )
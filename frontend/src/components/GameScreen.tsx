@@ -22,6 +22,10 @@ export default function GameScreen() {
         currentQuestion,
         teamACount,
         teamBCount,
+        roundNumber,
+        seriesLength,
+        seriesWins,
+        seriesWinner,
         reset,
     } = useGameStore();
 
@@ -43,12 +47,17 @@ export default function GameScreen() {
             sendMessage("answer", {
                 question_id: currentQuestion.id,
                 answer: parseFloat(answer),
+                client_time: Date.now(),
             });
         },
         [sendMessage, currentQuestion]
     );
 
-    const handlePlayAgain = useCallback(() => {
+    const handleRematch = useCallback(() => {
+        sendMessage("rematch");
+    }, [sendMessage]);
+
+    const handleLeave = useCallback(() => {
         reset();
         router.push("/");
     }, [reset, router]);
@@ -186,7 +195,13 @@ export default function GameScreen() {
                     teamAScore={teamAScore}
                     teamBScore={teamBScore}
                     myTeam={team}
-                    onPlayAgain={handlePlayAgain}
+                    roundNumber={roundNumber}
+                    seriesLength={seriesLength}
+                    seriesWins={seriesWins}
+                    seriesWinner={seriesWinner}
+                    onNextRound={handleStartGame}
+                    onRematch={handleRematch}
+                    onLeave={handleLeave}
                 />
             )}
         </div>
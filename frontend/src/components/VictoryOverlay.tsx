@@ -9,7 +9,13 @@ interface VictoryOverlayProps {
     teamAScore: number;
     teamBScore: number;
     myTeam: string;
-    onPlayAgain: () => void;
+    roundNumber: number;
+    seriesLength: number;
+    seriesWins: Record<string, number>;
+    seriesWinner: string | null;
+    onNextRound: () => void;
+    onRematch: () => void;
+    onLeave: () => void;
 }
 
 export default function VictoryOverlay({
@@ -17,10 +23,18 @@ export default function VictoryOverlay({
     teamAScore,
     teamBScore,
     myTeam,
-    onPlayAgain,
+    roundNumber,
+    seriesLength,
+    seriesWins,
+    seriesWinner,
+    onNextRound,
+    onRematch,
+    onLeave,
 }: VictoryOverlayProps) {
     const isWinner = winner === myTeam;
     const isDraw = winner === null;
+    const isSeries = seriesLength > 1;
+    const seriesOver = !isSeries || seriesWinner !== null;
 
     useEffect(() => {
         if (isWinner) {
@@ -96,6 +110,18 @@ export default function VictoryOverlay({
                             : "The other team was stronger this time."}
                 </p>
 
+                {isSeries && (
+                    <p className="text-white/70 text-sm font-bold uppercase tracking-wider mb-4">
+                        Round {roundNumber} of best-of-{seriesLength} · Series{" "}
+                        <span className="text-blue-400">{seriesWins.A ?? 0}</span>
+                        {" – "}
+                        <span className="text-orange-400">{seriesWins.B ?? 0}</span>
+                        {seriesWinner && (
+                            <> · {seriesWinner === "A" ? "Team Alpha" : "Team Beta"} takes it!</>
+                        )}
+                    </p>
+                )}
+
                 {/* Score Breakdown */}
                 <div className="flex justify-center gap-8 mb-8">
                     <div className={`text-center ${winner === "A" ? "scale-110" : ""}`}>
@@ -115,15 +141,21 @@ export default function VictoryOverlay({
                     </div>
                 </div>
 
-                {/* Play Again */}
+                {/* Next round / rematch in the same room */}
                 <motion.button
                     whileHover={{ scale: 1.05 }}
                     whileTap={{ scale: 0.95 }}
-                    onClick={onPlayAgain}
+                    onClick={seriesOver ? onRematch : onNextRound}
                     className="w-full py-4 bg-gradient-to-r from-purple-500 to-pink-500 hover:from-purple-600 hover:to-pink-600 text-white font-bold text-lg rounded-xl shadow-lg shadow-purple-500/25 transition-all"
                 >
-                    🔄 Play Again
+                    {seriesOver ? "🔄 Rematch" : "▶ Next Round"}
                 </motion.button>
+                <button
+                    onClick={onLeave}
+                    className="w-full mt-3 py-2 text-white/50 hover:text-white/80 text-sm font-semibold transition-colors"
+                >
+                    Leave Room
+                </button>
             </motion.div>
         </motion.div>
     );
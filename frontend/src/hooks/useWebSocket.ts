@@ -7,15 +7,20 @@ import { useCallback, useEffect, useRef } from "react";
 import { useGameStore } from "@/store/gameStore";
 
 const API_WS_URL = process.env.NEXT_PUBLIC_WS_URL || "ws://localhost:8000";
+const RECONNECT_BASE_DELAY_MS = 1000;
+const RECONNECT_MAX_DELAY_MS = 30000;
+// Going away, dropped without a close frame, try again later; every other
+// close (room gone, not a player, policy, frame too big) is final
+const RETRYABLE_CLOSE_CODES = new Set([1001, 1006, 1013]);
 
 export function useWebSocket() {
     const wsRef = useRef<WebSocket | null>(null);
+    const lastSeqRef = useRef<number | null>(null);
+    const closingRef = useRef(false);
+    const retriesRef = useRef(0);
     const {
         roomId,
         playerId,
-        userId,
-        username,
-        team,
         setQuestion,
         setTimer,
         updateGameState,
@@ -25,12 +30,13 @@ export function useWebSocket() {
     const connect = useCallback(() => {
         if (!roomId || !playerId) return;
 
-        const params = new URLSearchParams({
-            player_id: playerId,
-            user_id: userId,
-            username: username,
-            team: team,
-        });
+        // The server looks up our identity and team from player_id
+        const params = new URLSearchParams({ player_id: playerId });
+        // Resume from the last broadcast we saw instead of re-joining
+        if (lastSeqRef.current !== null) {
+            params.set("resume_from", String(lastSeqRef.current));
+        }
+        closingRef.current = false;
 
         const ws = new WebSocket(
             `${API_WS_URL}/ws/game/${roomId}?${params.toString()}`
@@ -41,12 +47,41 @@ export function useWebSocket() {
         };
 
         ws.onmessage = (event) => {
+            // The server only sends once it has let us in
+            retriesRef.current = 0;
             const message = JSON.parse(event.data);
+            if (typeof message.seq === "number") {
+                lastSeqRef.current = message.seq;
+            }
+            if (message.type === "ping") {
+                // Echo the server's clock with ours so it can estimate offset and RTT
+                ws.send(
+                    JSON.stringify({
+                        type: "pong",
+                        data: { server_time: message.data.server_time, client_time: Date.now() },
+                    })
+                );
+                return;
+            }
             handleMessage(message);
         };
 
-        ws.onclose = () => {
-            console.log("WebSocket disconnected");
+        ws.onclose = (event) => {
+            console.log("WebSocket disconnected", event.code, event.reason);
+            if (
+                closingRef.current ||
+                wsRef.current !== ws ||
+                !RETRYABLE_CLOSE_CODES.has(event.code)
+            ) {
+                return;
+            }
+            // Exponential backoff with jitter so a restarted server isn't stampeded
+            const ceiling = Math.min(
+                RECONNECT_MAX_DELAY_MS,
+                RECONNECT_BASE_DELAY_MS * 2 ** retriesRef.current
+            );
+            retriesRef.current += 1;
+            setTimeout(connect, ceiling / 2 + Math.random() * (ceiling / 2));
         };
 
         ws.onerror = (err) => {
@@ -54,7 +89,7 @@ export function useWebSocket() {
         };
 
         wsRef.current = ws;
-    }, [roomId, playerId, userId, username, team]);
+    }, [roomId, playerId]);
 
     const handleMessage = useCallback(
         (message: { type: string; data: Record<string, unknown> }) => {
@@ -70,6 +105,10 @@ export function useWebSocket() {
                             | "in_progress"
                             | "finished",
                         winner: message.data.winner as string | null,
+                        roundNumber: message.data.round_number as number,
+                        seriesLength: message.data.series_length as number,
+                        seriesWins: message.data.series_wins as Record<string, number>,
+                        seriesWinner: message.data.series_winner as string | null,
                     });
                     if (message.data.current_question) {
                         const q = message.data.current_question as {
@@ -120,6 +159,25 @@ export function useWebSocket() {
                     });
                     break;
 
+                case "team_activity": {
+                    // Large rooms report wrong answers as per-team counts
+                    const activity = message.data as Record<string, { wrong: number }>;
+                    const wrongA = activity.A?.wrong ?? 0;
+                    const wrongB = activity.B?.wrong ?? 0;
+                    if (wrongA || wrongB) {
+                        updateGameState({ lastWrongTeam: wrongA >= wrongB ? "A" : "B" });
+                    }
+                    break;
+                }
+
+                case "player_identity":
+                    // Quick-play rooms hand out provisional ids until first stored
+                    updateGameState({
+                        userId: message.data.user_id as string,
+                        roomCode: message.data.room_code as string,
+                    });
+                    break;
+
                 case "answer_result":
                     setAnswerFeedback(
                         (message.data as { correct: boolean }).correct ? "correct" : "wrong"
@@ -137,6 +195,9 @@ export function useWebSocket() {
                         teamAScore: message.data.team_a_score as number,
                         teamBScore: message.data.team_b_score as number,
                         ropePosition: message.data.rope_position as number,
+                        roundNumber: message.data.round_number as number,
+                        seriesWins: message.data.series_wins as Record<string, number>,
+                        seriesWinner: message.data.series_winner as string | null,
                     });
                     break;
             }
@@ -154,12 +215,16 @@ export function useWebSocket() {
     );
 
     const disconnect = useCallback(() => {
+        closingRef.current = true;
+        lastSeqRef.current = null;
+        retriesRef.current = 0;
         wsRef.current?.close();
         wsRef.current = null;
     }, []);
 
     useEffect(() => {
         return () => {
+            closingRef.current = true;
             wsRef.current?.close();
         };
     }, []);
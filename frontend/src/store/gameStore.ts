@@ -30,6 +30,12 @@ export interface GameState {
     teamACount: number;
     teamBCount: number;
 
+    // Best-of-N series
+    roundNumber: number;
+    seriesLength: number;
+    seriesWins: Record<string, number>;
+    seriesWinner: string | null;
+
     // UI state
     lastCorrectTeam: string | null;
     lastWrongTeam: string | null;
@@ -67,6 +73,10 @@ const initialState = {
     winner: null,
     teamACount: 0,
     teamBCount: 0,
+    roundNumber: 0,
+    seriesLength: 1,
+    seriesWins: { A: 0, B: 0 },
+    seriesWinner: null,
     lastCorrectTeam: null,
     lastWrongTeam: null,
     answerFeedback: null,